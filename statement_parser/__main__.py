@@ -0,0 +1,11 @@
+"""
+Allow running the CLI with `python -m statement_parser`.
+"""
+
+import sys
+
+from statement_parser.cli import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
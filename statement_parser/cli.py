@@ -0,0 +1,233 @@
+"""
+Command-line interface for the Statement Parser.
+
+Usage:
+    statement-parser --help
+    statement-parser statement.pdf
+    statement-parser --format csv statement.pdf
+    statement-parser --output-dir ./output *.pdf
+    statement-parser --jobs 4 *.pdf
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from pathlib import Path
+
+from statement_parser.parser import StatementParser, ParseOptions
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog='statement-parser',
+        description='Parse financial statements (bank, credit card, UPI) to Excel/CSV/JSON'
+    )
+
+    parser.add_argument(
+        'files',
+        nargs='+',
+        help='Statement files to parse (PDF, text, or CSV)'
+    )
+
+    parser.add_argument(
+        '-f', '--format',
+        choices=['excel', 'csv', 'json'],
+        default='excel',
+        help='Output format (default: excel)'
+    )
+
+    parser.add_argument(
+        '-o', '--output-dir',
+        default='.',
+        help='Output directory (default: current directory)'
+    )
+
+    parser.add_argument(
+        '-s', '--no-summary',
+        action='store_true',
+        help='Do not include summary sheet in Excel output'
+    )
+
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Suppress output messages'
+    )
+
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Do not deduplicate transactions'
+    )
+
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Show verbose output'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of files to parse in parallel (default: CPU count)'
+    )
+
+    return parser.parse_args()
+
+
+# Output format -> (file suffix, exporter taking result, path and options)
+_EXPORTERS = {
+    'excel': ('.xlsx', lambda result, path, options: result.to_excel(
+        path, include_summary=options.include_summary)),
+    'csv': ('.csv', lambda result, path, options: result.to_csv(path)),
+    'json': ('.json', lambda result, path, options: result.to_json(path)),
+}
+
+
+def process_file(filepath: Path, parser: StatementParser, options: ParseOptions, verbose: bool = False) -> tuple:
+    """
+    Process a single file.
+
+    Returns:
+        Tuple of (success, result_or_error)
+    """
+    try:
+        if verbose:
+            print(f"Parsing: {filepath.name}")
+
+        result = parser.parse_file(filepath, options)
+
+        # Export based on format
+        output_dir = Path(options.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        suffix, export = _EXPORTERS[options.output_format]
+        output_path = output_dir / f"{filepath.stem}_parsed{suffix}"
+        export(result, str(output_path), options)
+
+        return True, result
+
+    except Exception as e:
+        return False, str(e)
+
+
+# Parser owned by each worker process, created once by _init_worker
+_worker_parser = None
+
+
+def _init_worker(options: ParseOptions):
+    """Create the per-process parser for a worker."""
+    global _worker_parser
+    _worker_parser = StatementParser(options)
+
+
+def _process_in_worker(filepath: Path, options: ParseOptions, verbose: bool) -> tuple:
+    """Process a single file in a worker process."""
+    return process_file(filepath, _worker_parser, options, verbose)
+
+
+def _report_outcome(filepath: Path, success: bool, result, args) -> bool:
+    """Print the outcome of processing one file and return whether it succeeded."""
+    if success:
+        # Print summary
+        if not args.quiet:
+            summary = result.get_summary()
+            suffix = _EXPORTERS[args.format][0]
+            print(f"✓ {filepath.name}: {summary['total_transactions']} transactions")
+            print(f"  Type: {summary['statement_type']}, "
+                  f" Credits: ₹{summary['total_credits']:,.2f}, "
+                  f" Debits: ₹{summary['total_debits']:,.2f}")
+            print(f"  Output: {args.output_dir}/{filepath.stem}_parsed{suffix}")
+    elif not args.quiet:
+        print(f"✗ {filepath.name}: {result}")
+    return success
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+
+    # Create parser with options
+    options = ParseOptions(
+        output_format=args.format,
+        output_dir=args.output_dir,
+        include_summary=not args.no_summary,
+        normalize=True,
+        deduplicate=not args.no_dedup,
+    )
+
+    # Expand glob patterns
+    files = []
+    error_count = 0
+
+    for file_pattern in args.files:
+        p = Path(file_pattern)
+        if not p.is_absolute():
+            # Relative path, try glob first; it only yields existing paths
+            matched = False
+            for filepath in Path('.').glob(file_pattern):
+                files.append(filepath)
+                matched = True
+            if matched:
+                continue
+
+        # Absolute path or no glob match, use it directly
+        if not p.exists():
+            if not args.quiet:
+                print(f"Error: File not found: {p}")
+            error_count += 1
+            continue
+        files.append(p)
+
+    # Process files, in parallel when there is more than one to do
+    success_count = 0
+    results = []
+    jobs = max(1, min(args.jobs, len(files)))
+    remaining = files
+
+    if jobs > 1:
+        done = 0
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, initializer=_init_worker, initargs=(options,)
+            ) as executor:
+                outcomes = executor.map(_process_in_worker, files, repeat(options), repeat(args.verbose))
+                for success, result in outcomes:
+                    if _report_outcome(files[done], success, result, args):
+                        success_count += 1
+                        results.append((files[done], result))
+                    else:
+                        error_count += 1
+                    done += 1
+        except BrokenProcessPool as e:
+            # A worker died or could not start; parse what is left in this process
+            if not args.quiet:
+                print(f"Parallel parsing failed ({e}), continuing serially")
+        remaining = files[done:]
+
+    if remaining:
+        parser = StatementParser(options)
+        for filepath in remaining:
+            success, result = process_file(filepath, parser, options, args.verbose)
+            if _report_outcome(filepath, success, result, args):
+                success_count += 1
+                results.append((filepath, result))
+            else:
+                error_count += 1
+
+    # Final summary
+    if not args.quiet and results:
+        print(f"\nProcessed {success_count} file(s) successfully")
+        if error_count > 0:
+            print(f"Encountered {error_count} error(s)")
+
+    return 0 if error_count == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,13 +8,23 @@ Uses a hierarchy of detection strategies:
 4. Heuristic-based detection (table structure analysis)
 """
 
+import csv
 import re
-from typing import Optional, List, Dict, Any
+from itertools import islice
+from typing import Optional, List, Dict, Any, Set, Tuple
 from enum import Enum
+from functools import lru_cache
 
+from statement_parser.utils.text import head_lines
 
-class StatementType(Enum):
-    """Types of financial statements."""
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, install with the "fast" extra
+    ahocorasick = None
+
+
+class StatementType(str, Enum):
+    """Types of financial statements. Members compare equal to their values."""
     BANK = "bank"              # Bank account statements
     CREDIT_CARD = "credit_card"  # Credit card statements
     UPI = "upi"                # UPI/PhonePe/GooglePay statements
@@ -52,6 +62,107 @@ COMBINED_INDICATORS = [
     'statement 1', 'statement 2', 'part 1', 'part 2',
 ]
 
+# Pre-compiled regex patterns (compiled once at module load)
+_RE_ACCOUNT_NO = re.compile(r'account\s*(no\.?|number)\s*[:\s]*\d{10,}')
+_RE_INR = re.compile(r'INR\s*[0-9,]+\.\d{2}')
+_RE_CARD_NO = re.compile(r'card\s*(no\.?|number)\s*[:\s]*\d{4}[\s*]*\d{4}[\s*]*\d{4}')
+# Pieces of the UPI "Merchant Name / 12 ₹2,948.00 / Jan 26" block, scanned in order
+_RE_UPI_MERCHANT = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]')
+_RE_UPI_AMOUNT = re.compile(r'\d')
+_RE_UPI_DATE = re.compile(r'[A-Z][a-z]{2}\s+\d')
+_RE_HEADER_WORDS = re.compile(r'\b\w+\b')
+_RE_HEADER_UPPER = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+# Lookahead so overlapping indicators ("merged statement 1") are all seen
+_RE_COMBINED = re.compile('(?=(%s))' % '|'.join(
+    re.escape(indicator)
+    for indicator in sorted(COMBINED_INDICATORS, key=len, reverse=True)
+))
+# Indicators implied by a match, as a longer one hides its prefixes
+_COMBINED_PREFIXES = {
+    indicator: frozenset(other for other in COMBINED_INDICATORS if indicator.startswith(other))
+    for indicator in COMBINED_INDICATORS
+}
+
+# Score weight per keyword group
+_GROUP_WEIGHTS = (('header', 3), ('columns', 2), ('text', 1))
+
+
+def _keyword_weights(keywords: Dict[str, List[str]]) -> Tuple[Tuple[str, int], ...]:
+    """Flatten a keyword dict into (keyword, weight) pairs."""
+    return tuple(
+        (kw, weight)
+        for group, weight in _GROUP_WEIGHTS
+        for kw in keywords[group]
+    )
+
+
+_BANK_WEIGHTS = _keyword_weights(BANK_KEYWORDS)
+_CREDIT_CARD_WEIGHTS = _keyword_weights(CREDIT_CARD_KEYWORDS)
+_UPI_WEIGHTS = _keyword_weights(UPI_KEYWORDS)
+
+# UPI-specific header phrases (not just "UPI" appearing in narrations)
+_UPI_HEADER_KEYWORDS = ('upi ref', 'upi reference', 'upi id', 'upi transaction')
+
+# Every literal the scorers test for, including the unweighted checks
+_SCORE_KEYWORDS = frozenset(
+    kw for weights in (_BANK_WEIGHTS, _CREDIT_CARD_WEIGHTS, _UPI_WEIGHTS)
+    for kw, _ in weights
+).union(('debits', 'credits'), _UPI_HEADER_KEYWORDS)
+
+# Shortest line that can hold three distinct header keywords ("no ref chq")
+_MIN_HEADER_LENGTH = 10
+
+# Table headers sit near the top of a statement; never scan past this line
+_HEADER_SCAN_LINES = 200
+
+# Words that mark a table header line
+_HEADER_KEYWORDS = frozenset({
+    'date', 'description', 'amount', 'narration', 'withdrawal',
+    'deposit', 'balance', 'credit', 'debit', 'reference', 'merchant',
+    'transaction', 'value', 'chq', 'ref', 'no',
+})
+
+# Column names kept per header line, and delimiters the csv module splits
+_MAX_COLUMNS = 10
+_CSV_DELIMITERS = frozenset({'\t', '|', ','})
+
+# Recent documents whose detection results are memoized. Keyed on the full
+# text, so re-parsing the same statement skips the scan entirely.
+_DETECTION_CACHE_SIZE = 32
+
+# Bank score treated as decisive when no other type can still overtake it
+_CONFIDENT_BANK_SCORE = 9
+
+# Most the non-weighted checks can add on top of the keyword weights
+_MAX_CREDIT_CARD_BONUS = 7
+_MAX_UPI_BONUS = 6
+
+
+# Keywords shortest first, each with the shorter keywords it contains. A
+# keyword cannot occur in text where one of its substrings is missing.
+_SCORE_KEYWORD_FILTERS = tuple(
+    (kw, frozenset(sub for sub in _SCORE_KEYWORDS if sub != kw and sub in kw))
+    for kw in sorted(_SCORE_KEYWORDS, key=lambda kw: (len(kw), kw))
+)
+
+
+@lru_cache(maxsize=None)
+def _keyword_automaton():
+    """
+    Build an Aho-Corasick automaton over all scoring keywords, if available.
+
+    Built on first use rather than at import, so importing the package
+    costs nothing when scoring never runs.
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw in _SCORE_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
 
 def detect_statement_type(text: str) -> StatementType:
     """
@@ -69,130 +180,259 @@ def detect_statement_type(text: str) -> StatementType:
     return StatementType.BANK
 
 
-def _score_bank_statement(text: str) -> int:
-    """Score how likely text is a bank statement."""
-    score = 0
+def _find_keywords(text_lower: str) -> Set[str]:
+    """
+    Find every scoring keyword present in lowercased text.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, and
+    falls back to _find_keywords_by_substring otherwise.
+    """
+    automaton = _keyword_automaton()
+    if automaton is None:
+        return _find_keywords_by_substring(text_lower)
+
+    found = set()
+    for _, kw in automaton.iter(text_lower):
+        found.add(kw)
+        if len(found) == len(_SCORE_KEYWORDS):
+            break
+    return found
+
+
+def _find_keywords_by_substring(text_lower: str) -> Set[str]:
+    """
+    Find every scoring keyword present in lowercased text with substring checks.
+
+    Skips any keyword that contains an already-missing shorter keyword.
+    """
+    found = set()
+    missing = set()
+    for kw, substrings in _SCORE_KEYWORD_FILTERS:
+        if missing.isdisjoint(substrings) and kw in text_lower:
+            found.add(kw)
+        else:
+            missing.add(kw)
+    return found
+
+
+def _score_all(text: str, text_lower: Optional[str] = None,
+               found: Optional[Set[str]] = None,
+               settle_early: bool = False) -> Dict[StatementType, int]:
+    """
+    Score text against every statement type with one keyword pass.
+
+    Keyword weights are summed for every type first, then the pattern
+    checks add to the same dict. With settle_early, a confident bank score
+    that neither other type can reach skips the credit card and UPI
+    pattern scans, leaving those types at their keyword scores.
+
+    Args:
+        text: Statement text to analyze
+        text_lower: Lowercased text, if the caller already has it
+        found: Result of _find_keywords, if the caller already has it
+        settle_early: Stop once bank is certain to score highest
+
+    Returns:
+        Dict of StatementType to score, in bank, credit card, UPI order
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    if found is None:
+        found = _find_keywords(text_lower)
+
+    # Header (high), column (medium) and text (low) keywords
+    scores = {
+        StatementType.BANK: (_keyword_score(_BANK_WEIGHTS, found)
+                             + _bank_pattern_score(text, text_lower, found)),
+        StatementType.CREDIT_CARD: _keyword_score(_CREDIT_CARD_WEIGHTS, found),
+        StatementType.UPI: _keyword_score(_UPI_WEIGHTS, found),
+    }
+
+    bank = scores[StatementType.BANK]
+    if (settle_early and bank >= _CONFIDENT_BANK_SCORE
+            and bank >= scores[StatementType.CREDIT_CARD] + _MAX_CREDIT_CARD_BONUS
+            and bank >= scores[StatementType.UPI] + _MAX_UPI_BONUS):
+        return scores
 
-    # Header keywords (high weight)
-    for kw in BANK_KEYWORDS['header']:
-        if kw in text:
-            score += 3
+    scores[StatementType.CREDIT_CARD] += _credit_card_pattern_score(text_lower, found)
+    scores[StatementType.UPI] += _upi_pattern_score(text, found)
 
-    # Column keywords (medium weight)
-    for kw in BANK_KEYWORDS['columns']:
-        if kw in text:
-            score += 2
+    return scores
 
-    # Text indicators (medium weight)
-    for kw in BANK_KEYWORDS['text']:
-        if kw in text:
-            score += 1
+
+def _bank_pattern_score(text: str, text_lower: str, found: Set[str]) -> int:
+    """Score the bank statement checks beyond keyword weights."""
+    score = 0
 
     # Bank account patterns
-    if re.search(r'account\s*(no\.?|number)\s*[:\s]*\d{10,}', text):
+    if _RE_ACCOUNT_NO.search(text_lower):
         score += 2
 
     # Withdrawal/Deposit pattern (very strong for bank statements)
-    if 'withdrawal' in text and 'deposit' in text:
+    if 'withdrawal' in found and 'deposit' in found:
         score += 3
 
     # INR prefix pattern (very strong indicator for Indian bank statements)
     # Look for "INR X,XXX.XX" pattern
-    if re.search(r'INR\s*[0-9,]+\.\d{2}', text):
+    if _RE_INR.search(text):
         score += 3
 
     # Separate Debits/Credits columns (strong indicator for bank statements)
-    if 'debits' in text and 'credits' in text:
+    if 'debits' in found and 'credits' in found:
         score += 3
 
     return score
 
 
-def _score_credit_card(text: str) -> int:
-    """Score how likely text is a credit card statement."""
+def _credit_card_pattern_score(text_lower: str, found: Set[str]) -> int:
+    """Score the credit card checks beyond keyword weights (at most _MAX_CREDIT_CARD_BONUS)."""
     score = 0
 
-    # Header keywords (high weight)
-    for kw in CREDIT_CARD_KEYWORDS['header']:
-        if kw in text:
-            score += 3
-
-    # Column keywords (medium weight)
-    for kw in CREDIT_CARD_KEYWORDS['columns']:
-        if kw in text:
-            score += 2
-
-    # Text indicators (medium weight)
-    for kw in CREDIT_CARD_KEYWORDS['text']:
-        if kw in text:
-            score += 1
-
     # Total amount due / Minimum amount due (strong indicator for credit cards)
-    if 'total amount due' in text or 'minimum amount due' in text:
+    if 'total amount due' in found or 'minimum amount due' in found:
         score += 3
 
     # Card number pattern (strong indicator)
-    if re.search(r'card\s*(no\.?|number)\s*[:\s]*\d{4}[\s*]*\d{4}[\s*]*\d{4}', text):
+    if _RE_CARD_NO.search(text_lower):
         score += 3
 
     # Credit/Debit column pattern (weaker indicator - also appears in bank statements)
     # Reduce weight because bank statements also have debit/credit columns
-    if 'debit' in text and 'credit' in text:
+    if 'debit' in found and 'credit' in found:
         score += 1
 
     return score
 
 
-def _score_upi_statement(text: str) -> int:
-    """Score how likely text is a UPI/payment app statement."""
+def _upi_pattern_score(text: str, found: Set[str]) -> int:
+    """Score the UPI statement checks beyond keyword weights (at most _MAX_UPI_BONUS)."""
     score = 0
 
-    # Header keywords (high weight)
-    for kw in UPI_KEYWORDS['header']:
-        if kw in text:
-            score += 3
-
-    # Column keywords (medium weight)
-    for kw in UPI_KEYWORDS['columns']:
-        if kw in text:
-            score += 2
-
-    # Text indicators - reduce weight for "upi" in transaction descriptions
-    for kw in UPI_KEYWORDS['text']:
-        # Count occurrences - if it's just in transaction descriptions (not header/columns),
-        # don't give full weight
-        if kw in text:
-            score += 1
-
     # Stronger check: look for UPI-specific patterns (not just "UPI" appearing anywhere)
     # UPI statements typically have:
     # 1. "UPI" in header/column headers
     # 2. Merchant -> Amount -> Date pattern (not "UPI-SOMETHING" in narrations)
-    upi_in_headers = any(
-        kw in text.lower()
-        for kw in ['upi ref', 'upi reference', 'upi id', 'upi transaction']
-    )
-    if upi_in_headers:
+    if any(kw in found for kw in _UPI_HEADER_KEYWORDS):
         score += 3
 
     # Merchant + Amount + Date pattern (strong for UPI)
     # Look for patterns like "Merchant Name\n12 ₹2,948.00\nJan 26 Dr"
-    if re.search(r'[A-Z][a-z]+\s+[A-Z][a-z]+.*\n.*\d{1,2}\s*₹?.*\n.*[A-Z][a-z]{2}\s+\d{1,2}', text, re.DOTALL):
+    if _has_upi_transaction_block(text):
         score += 3
 
     return score
 
 
-def _is_combined_statement(text: str) -> bool:
-    """Check if text appears to be a combined/multi-statement file."""
-    indicator_count = 0
+def _infer_statement_type(text: str) -> StatementType:
+    """
+    Infer the statement type from the keyword and pattern scores.
 
-    for indicator in COMBINED_INDICATORS:
-        if indicator in text:
-            indicator_count += 1
+    The highest score wins, ties going to bank, then credit card. When the
+    bank score is confident and beyond what credit card or UPI could reach
+    even with every pattern matching, it returns early without running
+    their pattern scans.
 
-    # If multiple indicators found, likely combined
-    return indicator_count >= 2
+    Args:
+        text: Statement text to analyze
+
+    Returns:
+        Best-scoring StatementType, or UNKNOWN when nothing matched
+    """
+    scores = _score_all(text, settle_early=True)
+    best_type = max(scores, key=scores.get)
+    return best_type if scores[best_type] > 0 else StatementType.UNKNOWN
+
+
+def _keyword_score(weights: Tuple[Tuple[str, int], ...], found: Set[str]) -> int:
+    """Sum the weights of the keywords present in found."""
+    return sum(weight for kw, weight in weights if kw in found)
+
+
+def _score_bank_statement(text: str, text_lower: Optional[str] = None,
+                          found: Optional[Set[str]] = None) -> int:
+    """
+    Score how likely text is a bank statement.
+
+    Runs only the bank checks. Callers scoring more than one type should use
+    _score_all, or pass the same found set to each scorer so the keyword
+    pass runs once.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    if found is None:
+        found = _find_keywords(text_lower)
+    return _keyword_score(_BANK_WEIGHTS, found) + _bank_pattern_score(text, text_lower, found)
+
+
+def _score_credit_card(text: str, text_lower: Optional[str] = None,
+                       found: Optional[Set[str]] = None) -> int:
+    """
+    Score how likely text is a credit card statement.
+
+    Runs only the credit card checks; see _score_bank_statement for sharing
+    the keyword pass.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    if found is None:
+        found = _find_keywords(text_lower)
+    return _keyword_score(_CREDIT_CARD_WEIGHTS, found) + _credit_card_pattern_score(text_lower, found)
+
+
+def _score_upi_statement(text: str, text_lower: Optional[str] = None,
+                         found: Optional[Set[str]] = None) -> int:
+    """
+    Score how likely text is a UPI/payment app statement.
+
+    Runs only the UPI checks; see _score_bank_statement for sharing the
+    keyword pass.
+    """
+    if text_lower is None:
+        text_lower = text.lower()
+    if found is None:
+        found = _find_keywords(text_lower)
+    return _keyword_score(_UPI_WEIGHTS, found) + _upi_pattern_score(text, found)
+
+
+def _has_upi_transaction_block(text: str) -> bool:
+    """
+    Check for a merchant name, then an amount line, then a date line.
+
+    Each piece is located at the earliest position after the previous one.
+    That accepts exactly the texts the old single DOTALL regex did, but in
+    linear time instead of backtracking over every ``.*``.
+    """
+    match = _RE_UPI_MERCHANT.search(text)
+    if not match:
+        return False
+
+    newline = text.find('\n', match.end())
+    if newline == -1:
+        return False
+
+    match = _RE_UPI_AMOUNT.search(text, newline + 1)
+    if not match:
+        return False
+
+    newline = text.find('\n', match.end())
+    if newline == -1:
+        return False
+
+    return _RE_UPI_DATE.search(text, newline + 1) is not None
+
+
+def _is_combined_statement(text: str, text_lower: Optional[str] = None) -> bool:
+    """Check if text appears to be a combined/multi-statement file."""
+    if text_lower is None:
+        text_lower = text.lower()
+
+    # If multiple distinct indicators found, likely combined
+    found: Set[str] = set()
+    for match in _RE_COMBINED.finditer(text_lower):
+        found |= _COMBINED_PREFIXES[match.group(1)]
+        if len(found) >= 2:
+            return True
+    return False
 
 
 def detect_header_structure(text: str) -> Dict[str, Any]:
@@ -205,7 +445,6 @@ def detect_header_structure(text: str) -> Dict[str, Any]:
     Returns:
         Dict with structure analysis
     """
-    lines = text.splitlines()
     result = {
         'delimiter': None,
         'column_names': [],
@@ -213,45 +452,72 @@ def detect_header_structure(text: str) -> Dict[str, Any]:
         'header_line_index': -1,
     }
 
-    # Find potential header line
-    for i, line in enumerate(lines):
-        if _looks_like_header(line):
-            result['header_line_index'] = i
-            result['column_names'] = _extract_column_names(line)
-            result['delimiter'] = _detect_delimiter(line)
-            result['has_table_structure'] = True
-            break
+    header_index, header_line = _find_header_line(text)
+    if header_line is not None:
+        delimiter, column_names = _parse_header(header_line)
+        result['header_line_index'] = header_index
+        result['column_names'] = column_names
+        result['delimiter'] = delimiter
+        result['has_table_structure'] = True
 
     return result
 
 
-def _looks_like_header(line: str) -> bool:
-    """Check if a line looks like a table header."""
-    header_keywords = {
-        'date', 'description', 'amount', 'narration', 'withdrawal',
-        'deposit', 'balance', 'credit', 'debit', 'reference', 'merchant',
-        'transaction', 'value', 'chq', 'ref', 'no'
-    }
+@lru_cache(maxsize=_DETECTION_CACHE_SIZE)
+def _find_header_line(text: str) -> Tuple[int, Optional[str]]:
+    """Return the index and text of the first header-like line, or (-1, None)."""
+    for i, line in enumerate(head_lines(text, _HEADER_SCAN_LINES)):
+        # Too short to hold three header keywords - skip before lowercasing
+        if len(line) < _MIN_HEADER_LENGTH:
+            continue
+        if _looks_like_header(line):
+            return i, line
 
-    line_lower = line.lower()
-    words = set(re.findall(r'\b\w+\b', line_lower))
+    return -1, None
 
-    # Header should have at least 3 header keywords
-    matching_keywords = words.intersection(header_keywords)
-    return len(matching_keywords) >= 3
+
+def _looks_like_header(line: str) -> bool:
+    """Check if a line looks like a table header."""
+    # Header should have at least 3 distinct header keywords
+    seen = set()
+    for match in _RE_HEADER_WORDS.finditer(line.lower()):
+        word = match.group()
+        if word in _HEADER_KEYWORDS:
+            seen.add(word)
+            if len(seen) >= 3:
+                return True
+    return False
+
+
+def _parse_header(line: str) -> Tuple[str, List[str]]:
+    """Detect the delimiter of a header line and split it into column names."""
+    delimiter = _detect_delimiter(line)
+    return delimiter, _split_column_names(line, delimiter)
 
 
 def _extract_column_names(line: str) -> List[str]:
     """Extract column names from a header line."""
-    delimiter = _detect_delimiter(line)
+    return _parse_header(line)[1]
+
 
+def _split_column_names(line: str, delimiter: str) -> List[str]:
+    """Split a header line on an already-detected delimiter."""
     if delimiter == ' ':
         # For space-delimited, look for uppercase words (common in headers)
-        words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', line)
-        return [w.lower() for w in words[:10]]
+        words = _RE_HEADER_UPPER.findall(line)
+        return [w.lower() for w in words[:_MAX_COLUMNS]]
 
-    parts = [p.strip().lower() for p in line.split(delimiter)]
-    return [p for p in parts if p][:10]
+    parts = None
+    if delimiter in _CSV_DELIMITERS:
+        try:
+            parts = next(csv.reader([line], delimiter=delimiter), [])
+        except csv.Error:
+            pass
+    if parts is None:
+        parts = line.split(delimiter)
+
+    names = (p.strip().lower() for p in parts)
+    return list(islice(filter(None, names), _MAX_COLUMNS))
 
 
 def _detect_delimiter(line: str) -> str:
@@ -265,6 +531,40 @@ def _detect_delimiter(line: str) -> str:
     return ' '
 
 
+# Standard field names and the header variations that identify them
+_STANDARD_FIELDS = {
+    'date': ['date', 'posting date', 'transaction date', 'dt'],
+    'description': ['description', 'narration', 'merchant', 'payee',
+                    'transaction details', 'particulars'],
+    'amount': ['amount', 'value', 'dr', 'cr', 'debit', 'credit'],
+    'debit': ['debit', 'withdrawal', 'dr', 'amount'],
+    'credit': ['credit', 'deposit', 'cr', 'amount'],
+    'balance': ['balance', 'closing balance', 'balance'],
+    'reference': ['reference', 'ref no', 'chq no', 'txn id', 'ref'],
+}
+
+
+def _build_column_variations() -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Invert _STANDARD_FIELDS into (variation, field names) pairs.
+
+    A variation containing a shorter variation of the same field can never
+    be the one that matches, so it is dropped for that field.
+    """
+    lookup: Dict[str, List[str]] = {}
+    for field_name, variations in _STANDARD_FIELDS.items():
+        for var in variations:
+            if any(other != var and other in var for other in variations):
+                continue
+            field_names = lookup.setdefault(var, [])
+            if field_name not in field_names:
+                field_names.append(field_name)
+    return tuple((var, tuple(names)) for var, names in lookup.items())
+
+
+_COLUMN_VARIATIONS = _build_column_variations()
+
+
 def get_column_mapping(structure: Dict[str, Any]) -> Dict[str, int]:
     """
     Create a mapping of standard field names to column indices.
@@ -276,23 +576,15 @@ def get_column_mapping(structure: Dict[str, Any]) -> Dict[str, int]:
         Dict mapping standard names to column indices
     """
     column_names = structure.get('column_names', [])
-    mapping = {}
-
-    standard_fields = {
-        'date': ['date', 'posting date', 'transaction date', 'dt'],
-        'description': ['description', 'narration', 'merchant', 'payee',
-                        'transaction details', 'particulars'],
-        'amount': ['amount', 'value', 'dr', 'cr', 'debit', 'credit'],
-        'debit': ['debit', 'withdrawal', 'dr', 'amount'],
-        'credit': ['credit', 'deposit', 'cr', 'amount'],
-        'balance': ['balance', 'closing balance', 'balance'],
-        'reference': ['reference', 'ref no', 'chq no', 'txn id', 'ref'],
-    }
-
-    for field_name, variations in standard_fields.items():
-        for i, col_name in enumerate(column_names):
-            if any(var in col_name for var in variations):
-                mapping[field_name] = i
-                break
+    found = {}
+
+    # Each column claims every field whose variation it contains, first column wins
+    for i, col_name in enumerate(column_names):
+        for variation, field_names in _COLUMN_VARIATIONS:
+            if variation in col_name:
+                for field_name in field_names:
+                    found.setdefault(field_name, i)
+        if len(found) == len(_STANDARD_FIELDS):
+            break
 
-    return mapping
+    return {name: found[name] for name in _STANDARD_FIELDS if name in found}
@@ -13,9 +13,11 @@ Features:
 5. Pattern learning for improved future parsing
 """
 
+import csv
 import re
 import os
 import json
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
@@ -23,10 +25,247 @@ from statement_parser.formats.base import BaseParser, ParseResult
 from statement_parser.patterns.generic import (
     is_skip_line,
     parse_generic_line,
+    _match_generic_line,
     DATE_PATTERN_DDMMYYYY,
+    DATE_PATTERN_YYYYMMDD,
     AMOUNT_PATTERN,
 )
-from statement_parser.utils.formatting import parse_amount, parse_date
+from statement_parser.utils.formatting import parse_amount_cached, parse_date_cached
+from statement_parser.utils.text import head_lines
+
+
+# Pre-compiled regex patterns (compiled once at module load)
+_DATE_PATTERN_DDMMMYYYY = re.compile(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}')
+_INDIAN_DATE_PATTERN = re.compile(r'(\d{1,2} [A-Za-z]{3} \d{4})')
+_INR_AMOUNT_PATTERN = re.compile(r'INR ([\d,]+\.\d{2})')
+_REFERENCE_PATTERN = re.compile(r'[A-Z0-9]{6,}')
+# Credit keywords in a description, as whole words so "CR" does not fire
+# inside words like "SCRAP". "FT-" ends in a hyphen, so it only needs a
+# boundary before it ("FT- 123" and "FT-/..." count too).
+_CREDIT_KEYWORD_PATTERN = re.compile(
+    r'\b(?:CR|CRED|CREDIT|DEPOSIT|CREDCLUB|CRED\.C|NEFT|RTGS|IMPS|TRANSFER IN|CREDITED)\b|\bFT-',
+    re.IGNORECASE
+)
+# Transaction lines carry a numeric date, so lines without a digit are
+# rejected with this before the skip-line and transaction patterns run
+_HAS_DIGIT = re.compile(r'\d').search
+
+
+# Recent texts whose can_parse/CSV checks are memoized, keyed on the full text
+_PARSE_CHECK_CACHE_SIZE = 32
+
+
+# Words that mark text as a financial statement
+_FINANCIAL_INDICATORS = (
+    'account', 'balance', 'transaction', 'amount',
+    'credit', 'debit', 'deposit', 'withdrawal',
+    'statement', 'date', 'narration'
+)
+
+# Indicators usually appear in the opening lines; only lowercase the whole
+# text when this much of it does not already settle the check
+_INDICATOR_SCAN_CHARS = 4096
+
+# Column names that mark a comma-separated header line
+_CSV_HEADER_KEYWORDS = ('date', 'description', 'narration', 'debit', 'credit',
+                        'amount', 'balance', 'reference', 'value')
+
+# Substrings that identify each field's column in a CSV header, in priority order
+_CSV_COLUMN_VARIATIONS = (
+    ('date', ('date', 'posting', 'transaction', 'dt')),
+    ('description', ('description', 'narration', 'merchant', 'payee')),
+    ('debit', ('debit', 'withdrawal', 'dr', 'amount')),
+    ('credit', ('credit', 'deposit', 'cr')),
+    ('balance', ('balance', 'closing')),
+    ('reference', ('reference', 'ref', 'chq', 'txn')),
+)
+
+# Substrings that identify each field's column in a delimited header cell
+_COLUMN_MAP_VARIATIONS = (
+    ('date', ('date', 'posting', 'transaction', 'dt')),
+    ('description', ('description', 'narration', 'merchant', 'payee', 'particulars')),
+    ('debit', ('debit', 'withdrawal', 'dr', 'amount')),
+    ('credit', ('credit', 'deposit', 'cr')),
+    ('balance', ('balance', 'closing', 'current')),
+    ('reference', ('reference', 'ref', 'chq', 'txn', 'cheque')),
+)
+
+# Column names that mark the header row in column-based statements
+_COLUMN_HEADER_KEYWORDS = ('date', 'description', 'debit', 'credit', 'balance')
+
+# Lowercase terms that mark a summary line in Indian bank format statements
+_SUMMARY_LINE_TERMS = ('total', 'ending balance', 'opening balance', 'account summary')
+
+# Lowercase description words that mark a single amount column as a credit
+_CSV_CREDIT_KEYWORDS = ('cr', 'credit', 'deposit', 'neft', 'rtgs', 'imps')
+_PATTERN_CREDIT_KEYWORDS = ('cr', 'credit', 'deposit', 'neft', 'rtgs', 'imps', 'transfer in')
+# Each keyword list as one alternation, so a description is scanned once
+_CSV_CREDIT_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _CSV_CREDIT_KEYWORDS)))
+_PATTERN_CREDIT_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _PATTERN_CREDIT_KEYWORDS)))
+
+
+@lru_cache(maxsize=_PARSE_CHECK_CACHE_SIZE)
+def _looks_like_statement(text: str) -> bool:
+    """Check whether text has the indicators, dates, amounts and lines of a statement."""
+    # Must have at least some financial indicators; stop counting at three
+    head_lower = text[:_INDICATOR_SCAN_CHARS].lower()
+    found_indicators = 0
+    for indicator in _FINANCIAL_INDICATORS:
+        if indicator in head_lower:
+            found_indicators += 1
+            if found_indicators >= 3:
+                break
+    else:
+        if len(text) > _INDICATOR_SCAN_CHARS:
+            text_lower = text.lower()
+            found_indicators = sum(1 for indicator in _FINANCIAL_INDICATORS
+                                   if indicator in text_lower)
+    if found_indicators < 3:
+        return False
+
+    # Must have date patterns
+    if not (DATE_PATTERN_DDMMYYYY.search(text) or _DATE_PATTERN_DDMMMYYYY.search(text)):
+        return False
+
+    # Must have amount patterns
+    if not AMOUNT_PATTERN.search(text):
+        return False
+
+    # Must have some structure: more than five lines, one of them with
+    # content; the opening lines usually settle both without a full split
+    head = head_lines(text, 6)
+    if len(head) < 6:
+        return False
+    if any(len(line.strip()) > 10 for line in head):
+        return True
+    return any(len(line.strip()) > 10 for line in text.splitlines())
+
+
+@lru_cache(maxsize=_PARSE_CHECK_CACHE_SIZE)
+def _has_csv_header(text: str) -> bool:
+    """Check whether one of the first lines is a comma-separated header."""
+    # Look for header line with comma-separated column names
+    for line in head_lines(text, 5):
+        if not line.strip():
+            continue
+        # Check if line has comma-separated values that look like headers
+        parts = line.split(',')
+        if len(parts) >= 4:
+            line_lower = line.lower()
+            found_keywords = sum(1 for kw in _CSV_HEADER_KEYWORDS if kw in line_lower)
+            if found_keywords >= 3:
+                return True
+    return False
+
+
+def _split_csv_row(line: str, delimiter: str = ',') -> List[str]:
+    """
+    Split one CSV line with the csv module, honouring quoted delimiters.
+
+    Each line is read on its own so an unbalanced quote cannot swallow the
+    lines after it; malformed lines fall back to a plain split.
+    """
+    # Without quotes or line breaks the reader splits exactly like
+    # str.split, so skip building one
+    if line and '"' not in line and '\n' not in line and '\r' not in line:
+        return line.split(delimiter)
+    try:
+        return next(csv.reader((line,), delimiter=delimiter))
+    except (csv.Error, StopIteration):
+        return line.split(delimiter)
+
+
+def _is_word_char(char: str) -> bool:
+    """Check for a character the re module counts as \\w."""
+    return char.isalnum() or char == '_'
+
+
+def _strip_edge_punctuation(text: str) -> str:
+    """
+    Remove leading and trailing runs of non-word characters.
+
+    Scans in from both ends; an end-anchored regex would retry from every
+    position of each padding run inside a fixed-width line.
+    """
+    start, end = 0, len(text)
+    while start < end and not _is_word_char(text[start]):
+        start += 1
+    while end > start and not _is_word_char(text[end - 1]):
+        end -= 1
+    return text[start:end]
+
+
+def _is_number_token(token: str) -> bool:
+    """Check for a plain number like "250" or "1500.00"."""
+    integer_part, point, fraction = token.partition('.')
+    return integer_part.isdecimal() and (not point or fraction.isdecimal())
+
+
+def _strip_trailing_numbers(description: str) -> str:
+    """
+    Strip a trailing DD/MM/YYYY date and the run of plain numbers before it.
+
+    Expects single-spaced text. The numbers go in the same chunks as the
+    trailing amount, balance and number-run patterns that used to run one
+    after another, so a run of 2 or 4 numbers still leaves one behind.
+    """
+    # Every form ends in a digit, which most descriptions do not
+    if not description[-1:].isdecimal():
+        return description
+
+    head, space, last = description.rpartition(' ')
+    if space:
+        parts = last.split('/')
+        if (len(parts) == 3 and all(part.isdecimal() for part in parts)
+                and len(parts[0]) <= 2 and len(parts[1]) <= 2 and 2 <= len(parts[2]) <= 4):
+            description = head
+
+    # Up to six numbers can go; the first token has no space before it and stays
+    tokens = description.rsplit(' ', 6)
+    count = 0
+    for token in reversed(tokens[1:]):
+        if not _is_number_token(token):
+            break
+        count += 1
+
+    remove = _TRAILING_NUMBER_REMOVALS[count]
+    if not remove:
+        return description
+    return description[:-sum(len(token) + 1 for token in tokens[-remove:])]
+
+
+# Trailing numbers removed for each run length: one amount, then two
+# balance columns if at least two remain, then a run of two or three
+_TRAILING_NUMBER_REMOVALS = (0, 1, 1, 3, 3, 5, 6)
+
+
+# Distinct raw descriptions whose cleaned form is memoized
+_DESCRIPTION_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_DESCRIPTION_CACHE_SIZE)
+def _clean_description_text(description: str) -> str:
+    """
+    Clean up a non-empty transaction description.
+
+    Memoized, since statements repeat the same narrations (ATM withdrawals,
+    standing instructions, regular merchants) many times.
+    """
+    # Remove extra whitespace and normalize
+    description = ' '.join(description.split())
+
+    # Remove common formatting artifacts: a trailing date and the
+    # amount/balance numbers after it
+    description = _strip_trailing_numbers(description)
+
+    # Remove leading/trailing punctuation and spaces
+    description = description.strip(' .,-_:;@#')
+
+    # Limit length for practical purposes
+    if len(description) > 200:
+        description = description[:200]
+
+    return description
 
 
 class BankStatementParser(BaseParser):
@@ -49,27 +288,7 @@ class BankStatementParser(BaseParser):
         if not description:
             return ""
 
-        # Remove extra whitespace and normalize
-        description = ' '.join(description.split())
-
-        # Remove common formatting artifacts
-        # Remove date patterns at the end
-        description = re.sub(r'\s+\d{1,2}/\d{1,2}/\d{2,4}\s*$', '', description)
-        # Remove amount patterns at the end
-        description = re.sub(r'\s+\d+(?:\.\d+)?\s*$', '', description)
-        # Remove balance patterns
-        description = re.sub(r'\s+\d+(?:\.\d+)?\s+\d+(?:\.\d+)?\s*$', '', description)
-        # Remove multiple consecutive numbers
-        description = re.sub(r'\s+\d+(?:\.\d+)?\s+\d+(?:\.\d+)?(?:\s+\d+(?:\.\d+)?)?\s*$', '', description)
-
-        # Remove leading/trailing punctuation and spaces
-        description = description.strip(' .,-_:;@#')
-
-        # Limit length for practical purposes
-        if len(description) > 200:
-            description = description[:200]
-
-        return description
+        return _clean_description_text(description)
 
     def can_parse(self, text: str) -> bool:
         """
@@ -77,31 +296,11 @@ class BankStatementParser(BaseParser):
 
         This generic parser can handle any text that appears to be a financial statement
         by looking for common financial statement patterns.
-        """
-        text_lower = text.lower()
-
-        # Check for basic financial statement indicators
-        financial_indicators = [
-            'account', 'balance', 'transaction', 'amount',
-            'credit', 'debit', 'deposit', 'withdrawal',
-            'statement', 'date', 'narration'
-        ]
-
-        # Must have at least some financial indicators
-        found_indicators = sum(1 for indicator in financial_indicators if indicator in text_lower)
-
-        # Must have date patterns
-        has_dates = bool(DATE_PATTERN_DDMMYYYY.search(text) or
-                        re.search(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}', text))
-
-        # Must have amount patterns
-        has_amounts = bool(AMOUNT_PATTERN.search(text))
 
-        # Must have some structure
-        lines = text.splitlines()
-        has_structure = len(lines) > 5 and any(len(line.strip()) > 10 for line in lines)
-
-        return found_indicators >= 3 and has_dates and has_amounts and has_structure
+        Results are memoized per text, since the same statement is often
+        checked more than once.
+        """
+        return _looks_like_statement(text)
 
     def parse(self, text: str) -> ParseResult:
         """
@@ -117,18 +316,22 @@ class BankStatementParser(BaseParser):
         errors = []
         warnings = []
 
+        # Split once; the stages below share these instead of re-splitting
+        lines = text.splitlines()
+        stripped_lines = [line for line in map(str.strip, lines) if line]
+
         # Stage 1: Try CSV format parsing
         if ',' in text and self._has_csv_structure(text):
             try:
-                result = self._parse_csv(text)
-                transactions.extend(result)
+                # First stage, so the CSV rows can be taken as they are
+                transactions = self._parse_csv(text, lines)
             except Exception as e:
                 warnings.append(f"CSV parsing failed: {str(e)}")
 
         # Stage 2: Try adaptive pattern recognition
         if len(transactions) < 5:  # If CSV didn't yield enough results
             try:
-                result = self._parse_adaptive(text)
+                result = self._parse_adaptive(text, stripped_lines)
                 transactions.extend(result)
             except Exception as e:
                 warnings.append(f"Adaptive parsing failed: {str(e)}")
@@ -144,19 +347,21 @@ class BankStatementParser(BaseParser):
         # Stage 4: Fallback to generic parsing
         if len(transactions) < 1:  # If nothing worked
             try:
-                result = self._parse_generic_fallback(text)
+                result = self._parse_generic_fallback(text, stripped_lines)
                 transactions.extend(result)
             except Exception as e:
                 warnings.append(f"Fallback parsing failed: {str(e)}")
 
         # Deduplicate and validate
         transactions = self._deduplicate(transactions)
-        valid_transactions = []
-        for tx in transactions:
-            if self._validate_transaction(tx):
-                valid_transactions.append(tx)
-            else:
-                warnings.append(f"Invalid transaction: {tx.get('description', 'unknown')}")
+        valid_transactions = [tx for tx in transactions if self._validate_transaction(tx)]
+        if len(valid_transactions) != len(transactions):
+            # Only name the rejected ones when there are any
+            valid_ids = {id(tx) for tx in valid_transactions}
+            warnings.extend(
+                f"Invalid transaction: {tx.get('description', 'unknown')}"
+                for tx in transactions if id(tx) not in valid_ids
+            )
 
         return ParseResult(
             transactions=valid_transactions,
@@ -173,29 +378,13 @@ class BankStatementParser(BaseParser):
 
     def _has_csv_structure(self, text: str) -> bool:
         """Check if text has CSV structure with headers."""
-        lines = text.splitlines()
-        if not lines:
-            return False
+        return _has_csv_header(text)
 
-        # Look for header line with comma-separated column names
-        for line in lines[:5]:
-            if not line.strip():
-                continue
-            # Check if line has comma-separated values that look like headers
-            parts = line.split(',')
-            if len(parts) >= 4:
-                line_lower = line.lower()
-                header_keywords = ['date', 'description', 'narration', 'debit', 'credit',
-                                  'amount', 'balance', 'reference', 'value']
-                found_keywords = sum(1 for kw in header_keywords if kw in line_lower)
-                if found_keywords >= 3:
-                    return True
-        return False
-
-    def _parse_csv(self, text: str) -> List[Dict[str, Any]]:
-        """Parse CSV format bank statements."""
+    def _parse_csv(self, text: str, lines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Parse CSV format bank statements (lines: text.splitlines(), if already split)."""
         transactions = []
-        lines = text.splitlines()
+        if lines is None:
+            lines = text.splitlines()
 
         if not lines:
             return transactions
@@ -205,27 +394,20 @@ class BankStatementParser(BaseParser):
         column_mapping = {}
         delimiter = ','
 
-        header_keywords = {
-            'date': ['date', 'posting', 'transaction', 'dt'],
-            'description': ['description', 'narration', 'merchant', 'payee'],
-            'debit': ['debit', 'withdrawal', 'dr', 'amount'],
-            'credit': ['credit', 'deposit', 'cr'],
-            'balance': ['balance', 'closing'],
-            'reference': ['reference', 'ref', 'chq', 'txn'],
-        }
-
         for i, line in enumerate(lines):
             line_lower = line.lower()
-            parts = line.split(delimiter)
+            parts_lower = None
 
             # Check if this is a header line
             found_keywords = []
-            for field_name, variations in header_keywords.items():
+            for field_name, variations in _CSV_COLUMN_VARIATIONS:
                 for var in variations:
                     if var in line_lower:
                         # Find the column index
-                        for j, part in enumerate(parts):
-                            if var in part.lower():
+                        if parts_lower is None:
+                            parts_lower = [part.lower() for part in _split_csv_row(line, delimiter)]
+                        for j, part in enumerate(parts_lower):
+                            if var in part:
                                 if field_name not in column_mapping:
                                     column_mapping[field_name] = j
                                 break
@@ -236,38 +418,54 @@ class BankStatementParser(BaseParser):
                 header_idx = i
                 break
 
+        # Column index per field, or None when the header has no such column
+        date_idx = column_mapping.get('date')
+        description_idx = column_mapping.get('description')
+        debit_idx = column_mapping.get('debit')
+        credit_idx = column_mapping.get('credit')
+        balance_idx = column_mapping.get('balance')
+
+        # Columns a row needs for every mapped field to be present
+        min_cols = max(
+            (idx for idx in (date_idx, description_idx, debit_idx, credit_idx, balance_idx)
+             if idx is not None),
+            default=-1,
+        ) + 1
+
         # Now parse data rows
-        for i, line in enumerate(lines):
-            if i <= header_idx or not line.strip():
+        for line in lines[header_idx + 1:]:
+            if not line.strip():
                 continue
 
-            parts = line.split(delimiter)
+            parts = _split_csv_row(line, delimiter)
+            if len(parts) < min_cols:
+                # Short row: missing trailing columns read as empty
+                parts.extend([''] * (min_cols - len(parts)))
 
             # Extract fields based on column mapping
-            date_str = parts[column_mapping.get('date', 0)].strip() if 'date' in column_mapping and len(parts) > column_mapping['date'] else ''
-            narration = parts[column_mapping.get('description', 1)].strip() if 'description' in column_mapping and len(parts) > column_mapping['description'] else ''
-            debit_str = parts[column_mapping.get('debit', 3)].strip() if 'debit' in column_mapping and len(parts) > column_mapping['debit'] else ''
-            credit_str = parts[column_mapping.get('credit', 4)].strip() if 'credit' in column_mapping and len(parts) > column_mapping['credit'] else ''
-            balance_str = parts[column_mapping.get('balance', 6)].strip() if 'balance' in column_mapping and len(parts) > column_mapping['balance'] else ''
+            date_str = parts[date_idx].strip() if date_idx is not None else ''
+            narration = parts[description_idx].strip() if description_idx is not None else ''
+            debit_str = parts[debit_idx].strip() if debit_idx is not None else ''
+            credit_str = parts[credit_idx].strip() if credit_idx is not None else ''
+            balance_str = parts[balance_idx].strip() if balance_idx is not None else ''
 
             # Skip if no valid data
             if not date_str or (not debit_str and not credit_str):
                 continue
 
             # Parse values
-            date_normalized = parse_date(date_str)
+            date_normalized = parse_date_cached(date_str)
             if not date_normalized:
                 continue
 
-            debit = parse_amount(debit_str) if debit_str else 0.0
-            credit = parse_amount(credit_str) if credit_str else 0.0
-            balance = parse_amount(balance_str) if balance_str else 0.0
+            debit = parse_amount_cached(debit_str) if debit_str else 0.0
+            credit = parse_amount_cached(credit_str) if credit_str else 0.0
+            balance = parse_amount_cached(balance_str) if balance_str else 0.0
 
             # Handle cases where there's only one amount column
             if debit > 0 and credit == 0:
                 # Check if this is actually a credit transaction marked in description
-                narration_lower = narration.lower()
-                if any(keyword in narration_lower for keyword in ['cr', 'credit', 'deposit', 'neft', 'rtgs', 'imps']):
+                if _CSV_CREDIT_KEYWORD_PATTERN.search(narration.lower()):
                     credit = debit
                     debit = 0.0
             elif credit > 0 and debit == 0:
@@ -275,8 +473,7 @@ class BankStatementParser(BaseParser):
                 pass
             elif debit_str and not credit_str:
                 # Only debit column exists, check for credit indicators
-                narration_lower = narration.lower()
-                if any(keyword in narration_lower for keyword in ['cr', 'credit', 'deposit', 'neft', 'rtgs', 'imps']):
+                if _CSV_CREDIT_KEYWORD_PATTERN.search(narration.lower()):
                     credit = debit
                     debit = 0.0
 
@@ -304,7 +501,9 @@ class BankStatementParser(BaseParser):
         return transactions
 
     def _is_credit_transaction(self, line: str, value_date_match: re.Match,
-                                 after_value_date: str) -> bool:
+                                 after_value_date: str,
+                                 amounts: Optional[List[re.Match]] = None,
+                                 description: Optional[str] = None) -> bool:
         """
         Determine if a transaction is credit (deposit) or debit (withdrawal).
 
@@ -316,58 +515,60 @@ class BankStatementParser(BaseParser):
             line: Original line text
             value_date_match: Regex match for the value date
             after_value_date: Text after the value date
+            amounts: AMOUNT_PATTERN matches in after_value_date, if already found
+            description: Whitespace-normalized text before the value date, if
+                the caller already built it
 
         Returns:
             True if transaction is credit/deposit, False if debit/withdrawal
         """
         # Find all amounts in the after-value-date portion
-        amounts = list(AMOUNT_PATTERN.finditer(after_value_date))
+        if amounts is None:
+            amounts = list(AMOUNT_PATTERN.finditer(after_value_date))
 
         if len(amounts) < 2:
             return False
 
         # Check the gap between first amount and balance
-        first_amt_end = after_value_date.find(amounts[0].group(1)) + len(amounts[0].group(1))
-        balance_start = after_value_date.find(amounts[-1].group(1))
-        gap = after_value_date[first_amt_end:balance_start]
+        gap_len = amounts[-1].start(1) - amounts[0].end(1)
 
         # Large gap (5+ spaces) indicates deposit column (credit)
         # HDFC format: Withdrawal column is ~8 chars from value date, Deposit column is ~30+ chars
-        is_credit_by_gap = len(gap) >= 5
+        is_credit_by_gap = gap_len >= 5
 
         if is_credit_by_gap:
             return True
 
         # For collapsed PDF text (gap <= 2), use description clues
-        if len(gap) <= 2:
-            desc = line[:value_date_match.start()].strip()
-            desc = re.sub(r'\s{2,}', ' ', desc)  # Normalize whitespace
-            desc_upper = desc.upper()
+        if gap_len <= 2:
+            if description is None:
+                description = ' '.join(line[:value_date_match.start()].split())  # Normalize whitespace
 
             # Common credit keywords across bank statements
-            credit_keywords = ['CR', 'CRED', 'CREDIT', 'FT-', 'DEPOSIT', 'CREDCLUB',
-                             'CRED.C', 'NEFT', 'RTGS', 'IMPS', 'TRANSFER IN', 'CREDITED']
-            if any(kw in desc_upper for kw in credit_keywords):
+            if _CREDIT_KEYWORD_PATTERN.search(description):
                 return True
 
         return False
 
-    def _extract_transaction_amounts(self, after_value_date: str, is_credit: bool) -> tuple:
+    def _extract_transaction_amounts(self, after_value_date: str, is_credit: bool,
+                                     amounts: Optional[List[re.Match]] = None) -> tuple:
         """
         Extract withdrawal and deposit amounts from the after-value-date portion.
 
         Args:
             after_value_date: Text after the value date containing amounts
             is_credit: Whether this is a credit transaction
+            amounts: AMOUNT_PATTERN matches in after_value_date, if already found
 
         Returns:
             Tuple of (withdrawal, deposit)
         """
-        amounts = list(AMOUNT_PATTERN.finditer(after_value_date))
+        if amounts is None:
+            amounts = list(AMOUNT_PATTERN.finditer(after_value_date))
         if len(amounts) < 2:
             return (0.0, 0.0)
 
-        first_amount = parse_amount(amounts[0].group(1))
+        first_amount = parse_amount_cached(amounts[0].group(1))
 
         if is_credit:
             deposit = first_amount
@@ -378,7 +579,7 @@ class BankStatementParser(BaseParser):
 
         return (withdrawal, deposit)
 
-    def _parse_adaptive(self, text: str) -> List[Dict[str, Any]]:
+    def _parse_adaptive(self, text: str, lines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Parse bank statements using adaptive pattern recognition.
 
@@ -387,12 +588,15 @@ class BankStatementParser(BaseParser):
         2. Multi-line transaction formats
         3. Single-line transaction formats
         4. Mixed format detection
+
+        lines are the stripped, non-empty lines of text, if the caller has them.
         """
         transactions = []
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        if lines is None:
+            lines = [line for line in map(str.strip, text.splitlines()) if line]
 
         # Keep track of already parsed transactions to avoid duplicates
-        parsed_hashes = set()
+        parsed_keys = set()
 
         # Try different parsing strategies
         strategies = [
@@ -405,12 +609,14 @@ class BankStatementParser(BaseParser):
             if len(transactions) < 20:  # Continue trying if we don't have enough
                 try:
                     result = strategy(lines)
-                    # Only add unique transactions
+                    # Only add unique transactions; amounts compare by value, so an
+                    # int 1500 from one strategy matches 1500.0 from another
                     for tx in result:
-                        tx_hash = hash(f"{tx.get('date', '')}-{tx.get('description', '')}-{tx.get('debit', 0)}-{tx.get('credit', 0)}")
-                        if tx_hash not in parsed_hashes:
+                        tx_key = (tx.get('date', ''), tx.get('description', ''),
+                                  float(tx.get('debit') or 0), float(tx.get('credit') or 0))
+                        if tx_key not in parsed_keys:
                             transactions.append(tx)
-                            parsed_hashes.add(tx_hash)
+                            parsed_keys.add(tx_key)
                 except Exception:
                     continue  # Try next strategy
 
@@ -470,11 +676,11 @@ class BankStatementParser(BaseParser):
         transactions = []
 
         for line in lines:
-            if is_skip_line(line) or len(line) < 20:
+            if len(line) < 20 or not _HAS_DIGIT(line) or is_skip_line(line):
                 continue
 
-            # Try generic line parsing
-            match = parse_generic_line(line)
+            # Try generic line parsing (skip lines are already filtered out)
+            match = _match_generic_line(line)
             if match and match.amount > 0:
                 tx = self._convert_generic_match_to_transaction(match)
                 transactions.append(tx)
@@ -531,18 +737,26 @@ class BankStatementParser(BaseParser):
 
         return transactions
 
-    def _parse_generic_fallback(self, text: str) -> List[Dict[str, Any]]:
+    def _parse_generic_fallback(self, text: str, lines: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Generic fallback parsing for any unrecognized format.
 
         This method uses pattern matching and heuristics to extract transactions.
+        lines are the stripped, non-empty lines of text, if the caller has them.
         """
         transactions = []
-        lines = text.splitlines()
+
+        # Every line this accepts carries a date; text without one yields nothing
+        if not (DATE_PATTERN_DDMMYYYY.search(text) or
+                _DATE_PATTERN_DDMMMYYYY.search(text) or
+                DATE_PATTERN_YYYYMMDD.search(text)):
+            return transactions
+
+        if lines is None:
+            lines = [line for line in map(str.strip, text.splitlines()) if line]
 
         for line in lines:
-            line = line.strip()
-            if not line or len(line) < 15:
+            if len(line) < 15 or not _HAS_DIGIT(line):
                 continue
 
             # Skip header-like lines
@@ -564,11 +778,11 @@ class BankStatementParser(BaseParser):
         for line in lines:
             line = line.strip()
 
-            if is_skip_line(line) or len(line) < 10:
+            if len(line) < 10 or not _HAS_DIGIT(line) or is_skip_line(line):
                 continue
 
-            # Try generic parsing
-            match = parse_generic_line(line)
+            # Try generic parsing (skip lines are already filtered out)
+            match = _match_generic_line(line)
             if match and match.amount > 0:
                 tx = {
                     'date': match.date,
@@ -614,16 +828,6 @@ class BankStatementParser(BaseParser):
         if not lines:
             return {}
 
-        # Look for header row with recognizable column names
-        header_keywords = {
-            'date': ['date', 'posting', 'transaction', 'dt'],
-            'description': ['description', 'narration', 'merchant', 'payee', 'particulars'],
-            'debit': ['debit', 'withdrawal', 'dr', 'amount'],
-            'credit': ['credit', 'deposit', 'cr'],
-            'balance': ['balance', 'closing', 'current'],
-            'reference': ['reference', 'ref', 'chq', 'txn', 'cheque'],
-        }
-
         column_mapping = {}
 
         # Check first few lines for headers
@@ -637,7 +841,7 @@ class BankStatementParser(BaseParser):
             found_keywords = 0
             for j, part in enumerate(parts):
                 part_lower = part.strip().lower()
-                for field_name, variations in header_keywords.items():
+                for field_name, variations in _COLUMN_MAP_VARIATIONS:
                     if any(var in part_lower for var in variations):
                         if field_name not in column_mapping:
                             column_mapping[field_name] = j
@@ -656,13 +860,12 @@ class BankStatementParser(BaseParser):
             return 0
 
         # Look for the line after the header
-        header_keywords = ['date', 'description', 'debit', 'credit', 'balance']
         mapped_header_fields = list(header_mapping.keys())
 
         for i, line in enumerate(lines):
             line_lower = line.lower()
             # Check if this line contains header keywords
-            matching_headers = sum(1 for kw in header_keywords if kw in line_lower)
+            matching_headers = sum(1 for kw in _COLUMN_HEADER_KEYWORDS if kw in line_lower)
             if matching_headers >= 2:
                 # Return the next line as data start
                 return min(i + 1, len(lines) - 1)
@@ -710,14 +913,14 @@ class BankStatementParser(BaseParser):
                 reference = parts[header_mapping['reference']].strip()
 
             # Parse date
-            date_normalized = parse_date(date_str) if date_str else ""
+            date_normalized = parse_date_cached(date_str) if date_str else ""
             if not date_normalized:
                 return None
 
             # Parse amounts
-            debit = parse_amount(debit_str) if debit_str else 0.0
-            credit = parse_amount(credit_str) if credit_str else 0.0
-            balance = parse_amount(balance_str) if balance_str else 0.0
+            debit = parse_amount_cached(debit_str) if debit_str else 0.0
+            credit = parse_amount_cached(credit_str) if credit_str else 0.0
+            balance = parse_amount_cached(balance_str) if balance_str else 0.0
 
             # Skip zero-amount transactions
             if debit == 0 and credit == 0:
@@ -781,7 +984,7 @@ class BankStatementParser(BaseParser):
             # Check for reference number or additional details
             if 'ref' in line.lower() or 'reference' in line.lower():
                 # Extract reference number
-                ref_match = re.search(r'[A-Z0-9]{6,}', line)
+                ref_match = _REFERENCE_PATTERN.search(line)
                 if ref_match:
                     tx['reference'] = ref_match.group(0)
 
@@ -801,7 +1004,7 @@ class BankStatementParser(BaseParser):
                 continue
 
             # If line starts with a date, it's probably a new transaction
-            if DATE_PATTERN_DDMMYYYY.search(line):
+            if '/' in line and DATE_PATTERN_DDMMYYYY.search(line):
                 break
 
             # If line is very short or looks like a continuation, count it
@@ -829,7 +1032,7 @@ class BankStatementParser(BaseParser):
             return None
 
         date_str = date_match.group(1)
-        date_normalized = parse_date(date_str)
+        date_normalized = parse_date_cached(date_str)
         if not date_normalized:
             return None
 
@@ -843,7 +1046,7 @@ class BankStatementParser(BaseParser):
         # Take the first valid amount
         amount_str = amount_matches[0].group(1)
         suffix = amount_matches[0].group(2) or ""
-        amount = parse_amount(amount_str)
+        amount = parse_amount_cached(amount_str)
 
         if amount <= 0:
             return None
@@ -852,7 +1055,7 @@ class BankStatementParser(BaseParser):
         description_start = date_match.end()
         description_end = date_match.end() + after_date.find(amount_str)
         description = line[description_start:description_end].strip()
-        description = re.sub(r'^[^\w]+|[^\w]+$', '', description)  # Clean up
+        description = _strip_edge_punctuation(description)  # Clean up
 
         # Determine if credit or debit based on suffix or description keywords
         is_credit = False
@@ -861,13 +1064,15 @@ class BankStatementParser(BaseParser):
         else:
             # Check description for credit indicators
             desc_lower = description.lower()
-            credit_keywords = ['cr', 'credit', 'deposit', 'neft', 'rtgs', 'imps', 'transfer in']
-            is_credit = any(keyword in desc_lower for keyword in credit_keywords)
+            is_credit = _PATTERN_CREDIT_KEYWORD_PATTERN.search(desc_lower) is not None
+
+        # Clean once; description, narration and merchant share the result
+        description = self._clean_description(description)
 
         return {
             'date': date_normalized,
-            'description': self._clean_description(description),
-            'narration': self._clean_description(description),
+            'description': description,
+            'narration': description,
             'value_date': date_normalized,
             'debit': amount if not is_credit else 0,
             'credit': amount if is_credit else 0,
@@ -875,7 +1080,7 @@ class BankStatementParser(BaseParser):
             'reference': '',
             'card_no': '',
             'type': 'credit' if is_credit else 'debit',
-            'merchant': self._clean_description(description),
+            'merchant': description,
         }
 
     def _convert_generic_match_to_transaction(self, match) -> Dict[str, Any]:
@@ -898,6 +1103,8 @@ class BankStatementParser(BaseParser):
     def _parse_with_openai(self, prompt: str) -> List[Dict[str, Any]]:
         """Parse using OpenAI API."""
         try:
+            # Imported here so the SDK only loads when a key is set; a broken
+            # install then fails this call instead of importing the package
             import openai
             openai.api_key = os.environ.get('OPENAI_KEY')
 
@@ -946,7 +1153,6 @@ class BankStatementParser(BaseParser):
             # Extract JSON from response
             content = response.text
             # Find JSON in response
-            import json
             json_start = content.find('{')
             json_end = content.rfind('}') + 1
             if json_start >= 0 and json_end > json_start:
@@ -980,7 +1186,8 @@ class BankStatementParser(BaseParser):
                 continue
 
             # Skip summary lines
-            if any(skip_term in line.lower() for skip_term in ['total', 'ending balance', 'opening balance', 'account summary']):
+            line_lower = line.lower()
+            if any(skip_term in line_lower for skip_term in _SUMMARY_LINE_TERMS):
                 continue
 
             # Parse the line according to Indian bank format
@@ -997,42 +1204,42 @@ class BankStatementParser(BaseParser):
         # 30 Jun 2024 CREDIT INTEREST - INR 288.00 INR 196,912.56            (Credit)
 
         # Extract date first
-        date_match = re.search(r'(\d{1,2} [A-Za-z]{3} \d{4})', line)
+        date_match = _INDIAN_DATE_PATTERN.search(line)
         if not date_match:
             return None
 
         date_str = date_match.group(1)
-        date_normalized = parse_date(date_str)
+        date_normalized = parse_date_cached(date_str)
         if not date_normalized:
             return None
 
         # Extract everything after the date
         after_date = line[date_match.end():].strip()
 
-        # Look for amounts with INR prefix
-        amount_matches = list(re.finditer(r'INR ([\d,]+\.\d{2})', after_date))
-        if not amount_matches:
+        # Look for the first amount with INR prefix; the balance after it is not used
+        amount_match = _INR_AMOUNT_PATTERN.search(after_date)
+        if not amount_match:
             return None
 
-        # Extract the amounts
-        first_amount = parse_amount(amount_matches[0].group(1)) if amount_matches else 0.0
+        first_amount = parse_amount_cached(amount_match.group(1))
 
         # Determine if this is a credit or debit transaction
         # Strong indicators for credit transactions
+        line_upper = line.upper()
         is_credit = (
-            'CREDIT INTEREST' in line.upper() or
-            'INTEREST' in line.upper() and 'CREDIT' in line.upper() or
-            'NEFT' in line.upper() or
-            'RTGS' in line.upper() or
-            'IMPS' in line.upper() or
-            'TRANSFER IN' in line.upper()
+            'CREDIT INTEREST' in line_upper or
+            'INTEREST' in line_upper and 'CREDIT' in line_upper or
+            'NEFT' in line_upper or
+            'RTGS' in line_upper or
+            'IMPS' in line_upper or
+            'TRANSFER IN' in line_upper
         )
 
         # Check for dash to distinguish debit vs credit
         dash_pos = after_date.find(' - ')
 
         # Special handling for credit interest - these always have credit amounts
-        if 'CREDIT INTEREST' in line.upper():
+        if 'CREDIT INTEREST' in line_upper:
             is_credit = True
             # Credit interest format: "CREDIT INTEREST - INR XXXXX INR BALANCE"
             # The first amount is the credit amount
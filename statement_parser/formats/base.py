@@ -12,6 +12,22 @@ from statement_parser.utils.formatting import normalize_description, parse_date,
 from statement_parser.utils.validation import validate_transaction, deduplicate_transactions
 
 
+# Keywords that mark a header, summary or footer line
+_SKIP_LINE_KEYWORDS = (
+    'statement', 'page', 'page no', 'continued', 'end',
+    'summary', 'total', 'balance', 'credit limit',
+    'payment due', 'account summary', 'card summary',
+    'reward points', 'earnings', 'bonus', 'cashback',
+    'important', 'messages', 'notes', 'terms',
+    'transaction type', 'transaction date',
+    'description', 'amount', 'reference',
+    'opening balance', 'closing balance',
+    'thank you', 'regards', 'sincerely',
+)
+# All skip keywords as one alternation, so each line is scanned once
+_SKIP_LINE_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, _SKIP_LINE_KEYWORDS)))
+
+
 @dataclass
 class ParseResult:
     """Result of parsing a statement."""
@@ -102,17 +118,4 @@ class BaseParser(ABC):
         if len(line) < 5:
             return True
 
-        header_keywords = [
-            'statement', 'page', 'page no', 'continued', 'end',
-            'summary', 'total', 'balance', 'credit limit',
-            'payment due', 'account summary', 'card summary',
-            'reward points', 'earnings', 'bonus', 'cashback',
-            'important', 'messages', 'notes', 'terms',
-            'transaction type', 'transaction date',
-            'description', 'amount', 'reference',
-            'opening balance', 'closing balance',
-            'thank you', 'regards', 'sincerely',
-        ]
-
-        line_lower = line.lower()
-        return any(kw in line_lower for kw in header_keywords)
+        return _SKIP_LINE_KEYWORD_PATTERN.search(line.lower()) is not None
@@ -128,7 +128,7 @@ class StatementParser:
     def _select_parser(self, statement_type: StatementType) -> 'BaseParser':
         """Select the appropriate parser for the statement type."""
         for name, parser in self.parsers:
-            if parser.statement_type == statement_type.value:
+            if parser.statement_type == statement_type:
                 return parser
         # Default to generic parser
         return self.parsers[0][1]
@@ -178,15 +178,17 @@ class StatementParser:
 
     def _read_text_file(self, filepath: Path) -> str:
         """Read text from a text or CSV file."""
-        # Try UTF-8 first, then latin-1
+        # Read the bytes once, then try UTF-8 first, then latin-1
+        data = Path(filepath).read_bytes()
         encodings = ['utf-8', 'latin-1', 'cp1252']
 
         for encoding in encodings:
             try:
-                with open(filepath, 'r', encoding=encoding) as f:
-                    return f.read()
+                text = data.decode(encoding)
             except UnicodeDecodeError:
                 continue
+            # Match text-mode reads, which translate \r\n and \r to \n
+            return text.replace('\r\n', '\n').replace('\r', '\n')
 
         raise ValueError(f"Could not decode file {filepath} with any known encoding")
 
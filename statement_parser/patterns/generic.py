@@ -57,6 +57,22 @@ SKIP_PATTERNS = [
 ]
 
 
+# Pre-compiled skip checks (compiled once at module load)
+_SKIP_LINE_PATTERNS = [re.compile(pattern) for pattern in SKIP_PATTERNS]
+# All skip keywords as whole words, in one alternation so each line is scanned once
+_SKIP_KEYWORD_PATTERN = re.compile(r'\b(?:%s)\b' % '|'.join(
+    re.escape(keyword) for keyword in sorted(SKIP_KEYWORDS, key=lambda kw: (-len(kw), kw))
+))
+
+# Pre-compiled description cleanup patterns (compiled once at module load)
+_LEADING_DIGITS_PATTERN = re.compile(r'^[\d\s]+')
+
+# Column names that mark a table header line
+_TABLE_HEADER_KEYWORDS = ('date', 'description', 'amount', 'narration',
+                          'withdrawal', 'deposit', 'balance', 'credit',
+                          'debit', 'reference', 'chq', 'value')
+
+
 @dataclass
 class TransactionMatch:
     """Result of matching a line to a transaction pattern."""
@@ -72,16 +88,14 @@ def is_skip_line(line: str) -> bool:
     if not line or not line.strip():
         return True
 
-    line_lower = line.lower()
-
     # First check for patterns that indicate non-transaction lines
-    for pattern in SKIP_PATTERNS:
-        if re.match(pattern, line.strip()):
+    stripped = line.strip()
+    for pattern in _SKIP_LINE_PATTERNS:
+        if pattern.match(stripped):
             return True
 
     # Check if line looks like a transaction (has date AND amount)
     # If so, don't skip even if it contains skip keywords
-    from statement_parser.patterns.generic import DATE_PATTERN_DDMMYYYY, DATE_PATTERN_DDMMMYYYY, AMOUNT_PATTERN
     has_date = DATE_PATTERN_DDMMYYYY.search(line) or DATE_PATTERN_DDMMMYYYY.search(line)
     has_amount = AMOUNT_PATTERN.search(line)
     if has_date and has_amount:
@@ -90,13 +104,7 @@ def is_skip_line(line: str) -> bool:
 
     # For keywords, check if they appear as whole words, not as substrings
     # This prevents false positives like "credit" in "UPI-CREDCLUB"
-    for keyword in SKIP_KEYWORDS:
-        # Use word boundary matching
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, line_lower):
-            return True
-
-    return False
+    return _SKIP_KEYWORD_PATTERN.search(line.lower()) is not None
 
 
 def extract_date(line: str) -> Optional[str]:
@@ -116,14 +124,14 @@ def extract_date(line: str) -> Optional[str]:
     # Try DD Mon YYYY format
     match = DATE_PATTERN_DDMMMYYYY.search(line)
     if match:
-        from statement_parser.utils.formatting import parse_date
-        return parse_date(match.group(1))
+        from statement_parser.utils.formatting import parse_date_cached
+        return parse_date_cached(match.group(1))
 
     # Try YYYY-MM-DD format
     match = DATE_PATTERN_YYYYMMDD.search(line)
     if match:
-        from statement_parser.utils.formatting import parse_date
-        return parse_date(match.group(1))
+        from statement_parser.utils.formatting import parse_date_cached
+        return parse_date_cached(match.group(1))
 
     return None
 
@@ -158,10 +166,18 @@ def parse_generic_line(line: str) -> Optional[TransactionMatch]:
     if is_skip_line(line):
         return None
 
+    return _match_generic_line(line)
+
+
+def _match_generic_line(line: str) -> Optional[TransactionMatch]:
+    """Parse a line already known not to be a skip line (see parse_generic_line)."""
     date = extract_date(line)
     if not date:
         return None
 
+    # Position of the DD/MM/YYYY date, shared by the amount and description steps
+    date_match = DATE_PATTERN_DDMMYYYY.search(line)
+
     # Find all amount matches in the line
     amount_matches = list(AMOUNT_PATTERN.finditer(line))
     if not amount_matches:
@@ -186,7 +202,7 @@ def parse_generic_line(line: str) -> Optional[TransactionMatch]:
 
     if not end_match:
         # Fallback: use the first valid amount after the date
-        date_pos = DATE_PATTERN_DDMMYYYY.search(line).end()
+        date_pos = date_match.end()
         for match in amount_matches:
             if match.start() > date_pos:
                 end_match = match
@@ -209,15 +225,14 @@ def parse_generic_line(line: str) -> Optional[TransactionMatch]:
         return None
 
     # Extract description: everything between date and amount
-    date_match = DATE_PATTERN_DDMMYYYY.search(line)
     amount_match = end_match
 
     start_pos = date_match.end() if date_match else 0
     end_pos = amount_match.start()
 
     description = line[start_pos:end_pos].strip()
-    description = re.sub(r'^[\d\s]+', '', description)
-    description = re.sub(r'[\d\s]+$', '', description)
+    description = _LEADING_DIGITS_PATTERN.sub('', description)
+    description = _strip_trailing_digits(description)
     description = description.strip()
 
     if not description or len(description) < 3:
@@ -232,12 +247,26 @@ def parse_generic_line(line: str) -> Optional[TransactionMatch]:
     )
 
 
+def _strip_trailing_digits(text: str) -> str:
+    """
+    Remove the trailing run of digits and whitespace from text.
+
+    Walks back from the end; an end-anchored regex search would retry from
+    every position of each padding run in the middle of a fixed-width line.
+    """
+    end = len(text)
+    while end and (text[end - 1].isdecimal() or text[end - 1].isspace()):
+        end -= 1
+    return text[:end]
+
+
 def find_transactions_generic(text: str) -> List[TransactionMatch]:
     """Find all transactions in text using generic patterns."""
     transactions = []
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
 
-    for line in lines:
+    for line in map(str.strip, text.splitlines()):
+        if not line:
+            continue
         result = parse_generic_line(line)
         if result:
             transactions.append(result)
@@ -256,11 +285,8 @@ def extract_table_headers(text: str, delimiter: str = '\t') -> Optional[List[str
         for delim in ['\t', '|', '~', ',']:
             if delim in line:
                 parts = [p.strip() for p in line.split(delim)]
-                header_keywords = ['date', 'description', 'amount', 'narration',
-                                   'withdrawal', 'deposit', 'balance', 'credit',
-                                   'debit', 'reference', 'chq', 'value']
 
-                if any(kw in ' '.join(parts).lower() for kw in header_keywords):
+                if any(kw in ' '.join(parts).lower() for kw in _TABLE_HEADER_KEYWORDS):
                     return parts
 
     return None
@@ -300,12 +326,14 @@ def extract_amount_pattern(text: str) -> str:
 def extract_merchant_pattern(text: str) -> List[str]:
     """Extract merchant name patterns from transactions."""
     merchants = []
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
 
-    for line in lines:
-        if is_skip_line(line):
+    for line in map(str.strip, text.splitlines()):
+        if not line or is_skip_line(line):
             continue
-        match = parse_generic_line(line)
+        match = _match_generic_line(line)
         if match and match.description:
             merchants.append(match.description)
-    return merchants[:10]
+            # Only the first ten are returned, so stop scanning there
+            if len(merchants) == 10:
+                break
+    return merchants
@@ -16,6 +16,7 @@ from statement_parser.patterns.generic import (
     TransactionMatch,
     extract_amount,
     extract_date,
+    DATE_PATTERN_DDMMYYYY,
 )
 from statement_parser.utils.formatting import parse_amount, parse_date
 
@@ -68,6 +69,33 @@ HDFC_BANK_NARRATION_CONT = re.compile(
     re.IGNORECASE
 )
 
+# Pre-compiled description cleanup patterns (compiled once at module load)
+_TRAILING_POINTS_PATTERN = re.compile(r'\s+\d{1,3}$')
+_TRAILING_AMOUNT_PATTERN = re.compile(r'[0-9,]+\.\d{2}\s*(Cr|CR)?$')
+_TRAILING_REF_AMOUNT_PATTERN = re.compile(r'\d{10,20}\s*\d{2}/\d{2}/\d{4}\s*[0-9,]+\.\d{2}\s*$')
+
+# Reference number patterns, tried in order
+_REFERENCE_PATTERNS = (
+    re.compile(r'Ref#?\s*:?(\w+)', re.IGNORECASE),  # Ref# ABC123
+    re.compile(r'(?:Ref|Reference)\s*(?:No\.?)?\s*:?(\d{10,20})', re.IGNORECASE),  # Reference No: 1234567890
+    re.compile(r'(\d{12,20})', re.IGNORECASE),  # 12+ digit number
+)
+
+_PAGE_INDICATORS = ('page no', 'page no.', 'page:', 'continued', 'continue')
+
+# Account statement column/heading words, looked up with spaces removed
+_BANK_KEYWORDS = ('withdrawalamt', 'depositamt', 'closing balance', 'account branch')
+
+# Card transaction line (date, time, amount) in lower-cased statement text
+_CC_TRANSACTION_LINE_PATTERN = re.compile(r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\s+.*\d{1,3},?\d*\.?\d{2}\s*(cr)?')
+
+# Statement period patterns
+_STATEMENT_PERIOD_PATTERN = re.compile(
+    r'(?:Statement From|Statement\s+Period)[^\d]*(\d{2}/\d{2}/\d{4})\s*[Tt]o[:\s]*(\d{2}/\d{2}/\d{4})',
+    re.IGNORECASE
+)
+_DATE_RANGE_PATTERN = re.compile(r'(\d{2}/\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{2}/\d{4})')
+
 
 def is_hdfc_credit_card(text: str) -> bool:
     """Check if text appears to be an HDFC credit card statement."""
@@ -75,7 +103,7 @@ def is_hdfc_credit_card(text: str) -> bool:
 
     # Look for HDFC-specific patterns - must have actual transaction format
     # (date followed by time and amount) - this is the most reliable indicator
-    if re.search(r'\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}\s+.*\d{1,3},?\d*\.?\d{2}\s*(cr)?', text_lower):
+    if _CC_TRANSACTION_LINE_PATTERN.search(text_lower):
         return True
 
     # HDFC Billed Statements format
@@ -94,9 +122,9 @@ def is_hdfc_bank_statement(text: str) -> bool:
         return True
 
     # Check for bank statement specific patterns
-    bank_keywords = ['withdrawalamt', 'depositamt', 'closing balance', 'account branch']
-    for kw in bank_keywords:
-        if kw in text_lower.replace(' ', ''):
+    text_compact = text_lower.replace(' ', '')
+    for kw in _BANK_KEYWORDS:
+        if kw in text_compact:
             return True
 
     return False
@@ -116,6 +144,11 @@ def parse_hdfc_credit_card_line(line: str) -> Optional[TransactionMatch]:
     Returns:
         TransactionMatch if successful, None otherwise
     """
+    # Both card patterns start with a DD/MM/YYYY date; reject other lines
+    # before the skip-line checks and the full patterns run
+    if not (line[2:3] == '/' and line[5:6] == '/' and line[:2].isdigit()):
+        return None
+
     if is_skip_line(line):
         return None
 
@@ -133,10 +166,10 @@ def parse_hdfc_credit_card_line(line: str) -> Optional[TransactionMatch]:
 
         # Clean up description
         # Remove trailing points number (single digit at end)
-        description = re.sub(r'\s+\d{1,3}$', '', description).strip()
+        description = _TRAILING_POINTS_PATTERN.sub('', description).strip()
 
         # Remove amount from end
-        description = re.sub(r'[0-9,]+\.\d{2}\s*(Cr|CR)?$', '', description).strip()
+        description = _TRAILING_AMOUNT_PATTERN.sub('', description).strip()
 
         if not description or len(description) < 3:
             return None
@@ -162,7 +195,7 @@ def parse_hdfc_credit_card_line(line: str) -> Optional[TransactionMatch]:
             return None
 
         # Clean up reference number and points
-        description = re.sub(r'\d{10,20}\s*\d{2}/\d{2}/\d{4}\s*[0-9,]+\.\d{2}\s*$', '', description).strip()
+        description = _TRAILING_REF_AMOUNT_PATTERN.sub('', description).strip()
 
         if not description or len(description) < 3:
             return None
@@ -195,22 +228,23 @@ def parse_hdfc_bank_statement(text: str) -> List[TransactionMatch]:
         List of TransactionMatch objects
     """
     transactions = []
-    lines = text.splitlines()
-
-    i = 0
     current_tx = None
     narration_buffer = []
 
-    while i < len(lines):
-        line = lines[i].strip()
+    # Every transaction row has a DD/MM/YY date; without one there is nothing to scan
+    if not DATE_PATTERN_DDMMYYYY.search(text):
+        return transactions
 
+    for line in map(str.strip, text.splitlines()):
         # Skip headers and empty lines
         if not line or HDFC_BANK_HEADER.match(line) or 'page' in line.lower():
-            i += 1
             continue
 
-        # Try to match transaction line
-        match = HDFC_BANK_TX_PATTERN.match(line)
+        # Try to match transaction line; these start with a DD/MM/YY date,
+        # so check those characters before running the full pattern
+        match = None
+        if line[2:3] == '/' and line[5:6] == '/' and line[:2].isdigit():
+            match = HDFC_BANK_TX_PATTERN.match(line)
         if match:
             # Save previous transaction if any
             if current_tx:
@@ -247,9 +281,7 @@ def parse_hdfc_bank_statement(text: str) -> List[TransactionMatch]:
         else:
             # This might be a continuation of narration
             if current_tx and line and not HDFC_BANK_NARRATION_CONT.match(line):
-                narration_buffer.append(line.strip())
-
-        i += 1
+                narration_buffer.append(line)
 
     # Don't forget the last transaction
     if current_tx:
@@ -271,14 +303,8 @@ def extract_hdfc_reference(line: str) -> Optional[str]:
         Reference number or None
     """
     # Look for reference patterns
-    patterns = [
-        r'Ref#?\s*:?(\w+)',  # Ref# ABC123
-        r'(?:Ref|Reference)\s*(?:No\.?)?\s*:?(\d{10,20})',  # Reference No: 1234567890
-        r'(\d{12,20})',  # 12+ digit number
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, line, re.IGNORECASE)
+    for pattern in _REFERENCE_PATTERNS:
+        match = pattern.search(line)
         if match:
             return match.group(1)
 
@@ -295,8 +321,8 @@ def is_hdfc_page_header(line: str) -> bool:
     Returns:
         True if this is a page header line
     """
-    page_indicators = ['page no', 'page no.', 'page:', 'continued', 'continue']
-    return any(ind in line.lower() for ind in page_indicators)
+    line_lower = line.lower()
+    return any(ind in line_lower for ind in _PAGE_INDICATORS)
 
 
 def extract_hdfc_statement_dates(text: str) -> Optional[Tuple[str, str]]:
@@ -310,19 +336,12 @@ def extract_hdfc_statement_dates(text: str) -> Optional[Tuple[str, str]]:
         Tuple of (from_date, to_date) or None
     """
     # Pattern: "Statement From: DD/MM/YYYY To: DD/MM/YYYY"
-    match = re.search(
-        r'(?:Statement From|Statement\s+Period)[^\d]*(\d{2}/\d{2}/\d{4})\s*[Tt]o[:\s]*(\d{2}/\d{2}/\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    match = _STATEMENT_PERIOD_PATTERN.search(text)
     if match:
         return (match.group(1), match.group(2))
 
     # Alternative pattern
-    match = re.search(
-        r'(\d{2}/\d{2}/\d{4})\s*[-–]\s*(\d{2}/\d{2}/\d{4})',
-        text
-    )
+    match = _DATE_RANGE_PATTERN.search(text)
     if match:
         return (match.group(1), match.group(2))
 
@@ -48,6 +48,35 @@ ICICI_BANK_HEADER = re.compile(
     re.IGNORECASE
 )
 
+# Pre-compiled description cleanup patterns (compiled once at module load)
+_TRAILING_POINTS_PERCENT_PATTERN = re.compile(r'\s+[-\d]+%?\s*$')
+_TRAILING_POINTS_PATTERN = re.compile(r'\s+\d{1,3}$')
+
+# Reference number patterns, tried in order
+_REFERENCE_PATTERNS = (
+    re.compile(r'\b(\d{11,12})\b'),  # 11-12 digit reference number
+    re.compile(r'Ref#?\s*:?(\w+)', re.IGNORECASE),  # Ref# ABC123
+    re.compile(r'(?:Ref|Reference)\s*(?:No\.?)?\s*:?(\d{10,20})', re.IGNORECASE),  # Reference No: 1234567890
+)
+
+_PAGE_INDICATORS = ('page', 'continued', 'continue', 'page no')
+_REWARD_KEYWORDS = ('earnings', 'points', 'reward', 'bonus', 'cashback')
+# Account statement column/heading words, looked up with spaces removed
+_BANK_KEYWORDS = ('withdrawal', 'deposit', 'balance', 'account no')
+
+# "icici ... card ... 1234" in lower-cased statement text
+_ICICI_CARD_PATTERN = re.compile(r'icici.*card.*\d{4}')
+
+# Statement period patterns, DD Mon YYYY and DD/MM/YYYY
+_STATEMENT_PERIOD_PATTERN = re.compile(
+    r'Statement\s+period\s*[:\s]*(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})\s*[Tt]o\s*(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})',
+    re.IGNORECASE
+)
+_STATEMENT_PERIOD_SLASH_PATTERN = re.compile(
+    r'Statement\s+period\s*[:\s]*(\d{2}/\d{2}/\d{4})\s*[Tt]o\s*(\d{2}/\d{2}/\d{4})',
+    re.IGNORECASE
+)
+
 
 def is_icici_credit_card(text: str) -> bool:
     """Check if text appears to be an ICICI credit card statement."""
@@ -62,7 +91,7 @@ def is_icici_credit_card(text: str) -> bool:
         return True
 
     # Look for ICICI-specific patterns
-    if re.search(r'icici.*card.*\d{4}', text_lower):
+    if _ICICI_CARD_PATTERN.search(text_lower):
         return True
 
     return False
@@ -77,9 +106,9 @@ def is_icici_bank_statement(text: str) -> bool:
         return True
 
     # Check for bank statement specific patterns
-    bank_keywords = ['withdrawal', 'deposit', 'balance', 'account no']
-    for kw in bank_keywords:
-        if kw in text_lower.replace(' ', ''):
+    text_compact = text_lower.replace(' ', '')
+    for kw in _BANK_KEYWORDS:
+        if kw in text_compact:
             return True
 
     return False
@@ -99,6 +128,11 @@ def parse_icici_credit_card_line(line: str) -> Optional[TransactionMatch]:
     Returns:
         TransactionMatch if successful, None otherwise
     """
+    # Both card patterns start with a DD/MM/YYYY date; reject other lines
+    # before the skip-line checks and the full patterns run
+    if not (line[2:3] == '/' and line[5:6] == '/' and line[:2].isdigit()):
+        return None
+
     if is_skip_line(line):
         return None
 
@@ -117,9 +151,9 @@ def parse_icici_credit_card_line(line: str) -> Optional[TransactionMatch]:
 
         # Clean up description
         # Remove trailing points/percentage
-        description = re.sub(r'\s+[-\d]+%?\s*$', '', description).strip()
+        description = _TRAILING_POINTS_PERCENT_PATTERN.sub('', description).strip()
         # Remove trailing reference-like patterns
-        description = re.sub(r'\s+\d{1,3}$', '', description).strip()
+        description = _TRAILING_POINTS_PATTERN.sub('', description).strip()
 
         if not description or len(description) < 3:
             return None
@@ -147,7 +181,7 @@ def parse_icici_credit_card_line(line: str) -> Optional[TransactionMatch]:
             return None
 
         # Clean up description
-        description = re.sub(r'\s+\d{1,3}$', '', description).strip()
+        description = _TRAILING_POINTS_PATTERN.sub('', description).strip()
 
         if not description or len(description) < 3:
             return None
@@ -173,19 +207,9 @@ def extract_icici_reference(line: str) -> Optional[str]:
     Returns:
         Reference number or None
     """
-    # Look for 11-12 digit reference number
-    match = re.search(r'\b(\d{11,12})\b', line)
-    if match:
-        return match.group(1)
-
-    # Try other reference patterns
-    patterns = [
-        r'Ref#?\s*:?(\w+)',  # Ref# ABC123
-        r'(?:Ref|Reference)\s*(?:No\.?)?\s*:?(\d{10,20})',  # Reference No: 1234567890
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, line, re.IGNORECASE)
+    # Look for an 11-12 digit reference number, then other reference patterns
+    for pattern in _REFERENCE_PATTERNS:
+        match = pattern.search(line)
         if match:
             return match.group(1)
 
@@ -202,8 +226,8 @@ def is_icici_page_header(line: str) -> bool:
     Returns:
         True if this is a page header line
     """
-    page_indicators = ['page', 'continued', 'continue', 'page no']
-    return any(ind in line.lower() for ind in page_indicators)
+    line_lower = line.lower()
+    return any(ind in line_lower for ind in _PAGE_INDICATORS)
 
 
 def extract_icici_statement_dates(text: str) -> Optional[Tuple[str, str]]:
@@ -217,20 +241,12 @@ def extract_icici_statement_dates(text: str) -> Optional[Tuple[str, str]]:
         Tuple of (from_date, to_date) or None
     """
     # Pattern: "Statement period : DD Mon YYYY to DD Mon YYYY"
-    match = re.search(
-        r'Statement\s+period\s*[:\s]*(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})\s*[Tt]o\s*(\d{1,2}\s+[A-Za-z]{3}\s+\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    match = _STATEMENT_PERIOD_PATTERN.search(text)
     if match:
         return (match.group(1), match.group(2))
 
     # Alternative pattern with DD/MM/YYYY
-    match = re.search(
-        r'Statement\s+period\s*[:\s]*(\d{2}/\d{2}/\d{4})\s*[Tt]o\s*(\d{2}/\d{2}/\d{4})',
-        text,
-        re.IGNORECASE
-    )
+    match = _STATEMENT_PERIOD_SLASH_PATTERN.search(text)
     if match:
         return (match.group(1), match.group(2))
 
@@ -247,5 +263,5 @@ def is_icici_reward_line(line: str) -> bool:
     Returns:
         True if this is a reward line
     """
-    reward_keywords = ['earnings', 'points', 'reward', 'bonus', 'cashback']
-    return any(kw in line.lower() for kw in reward_keywords)
+    line_lower = line.lower()
+    return any(kw in line_lower for kw in _REWARD_KEYWORDS)
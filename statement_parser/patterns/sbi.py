@@ -16,7 +16,7 @@ from statement_parser.patterns.generic import (
     extract_amount,
     extract_date,
 )
-from statement_parser.utils.formatting import parse_amount, parse_date
+from statement_parser.utils.formatting import parse_amount, parse_date_cached
 
 
 # SBI Credit Card pattern
@@ -43,6 +43,23 @@ SBI_PERIOD_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Keywords for classifying single lines
+_PAGE_INDICATORS = ('page', 'continued', 'continue', 'page no', 'sbi card')
+_SUMMARY_KEYWORDS = (
+    'total', 'amount due', 'minimum amount', 'opening balance',
+    'closing balance', 'payments', 'credits', 'debits'
+)
+_REWARD_KEYWORDS = ('cashback', 'bonus', 'reward', 'points')
+
+# Account statement column/heading words
+_BANK_KEYWORDS = ('withdrawal', 'deposit', 'balance', 'narration')
+
+# Card transaction line (DD Mon YY ... amount D/C) in lower-cased statement text
+_CC_TRANSACTION_LINE_PATTERN = re.compile(
+    r'\d{1,2}\s+[A-Za-z]{3}\s+\d{2}\s+.*\d{1,3},?\d*\.?\d{2}\s*[DC]\s*$',
+    re.MULTILINE
+)
+
 
 def is_sbi_card(text: str) -> bool:
     """Check if text appears to be an SBI Card statement."""
@@ -50,7 +67,7 @@ def is_sbi_card(text: str) -> bool:
 
     # Strong indicators - must have actual SBI-specific patterns
     # Check for SBI credit card pattern first (DD Mon YY format with D/C suffix)
-    if re.search(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{2}\s+.*\d{1,3},?\d*\.?\d{2}\s*[DC]\s*$', text_lower, re.MULTILINE):
+    if _CC_TRANSACTION_LINE_PATTERN.search(text_lower):
         return True
 
     # SBI Card header indicators
@@ -69,8 +86,7 @@ def is_sbi_bank_statement(text: str) -> bool:
         return True
 
     # Check for bank statement specific patterns
-    bank_keywords = ['withdrawal', 'deposit', 'balance', 'narration']
-    for kw in bank_keywords:
+    for kw in _BANK_KEYWORDS:
         if kw in text_lower:
             return True
 
@@ -91,6 +107,11 @@ def parse_sbi_credit_card_line(line: str) -> Optional[TransactionMatch]:
     Returns:
         TransactionMatch if successful, None otherwise
     """
+    # The card pattern starts with the day number; reject other lines
+    # before the skip-line checks and the full pattern run
+    if not line[:1].isdigit():
+        return None
+
     if is_skip_line(line):
         return None
 
@@ -116,13 +137,13 @@ def parse_sbi_credit_card_line(line: str) -> Optional[TransactionMatch]:
 
             # Reconstruct date string
             date_str = f"{day} {month} {year}"
-            parsed = parse_date(date_str)
+            parsed = parse_date_cached(date_str)
             if not parsed:
                 from datetime import datetime
                 parsed_dt = datetime.strptime(date_str, "%d %b %Y")
                 parsed = parsed_dt.strftime("%d/%m/%Y")
         except Exception:
-            parsed = parse_date(date_str)
+            parsed = parse_date_cached(date_str)
 
         amount = parse_amount(amount_str)
         if amount <= 0:
@@ -170,8 +191,8 @@ def is_sbi_page_header(line: str) -> bool:
     Returns:
         True if this is a page header line
     """
-    page_indicators = ['page', 'continued', 'continue', 'page no', 'sbi card']
-    return any(ind in line.lower() for ind in page_indicators)
+    line_lower = line.lower()
+    return any(ind in line_lower for ind in _PAGE_INDICATORS)
 
 
 def extract_sbi_statement_dates(text: str) -> Optional[Tuple[str, str]]:
@@ -201,11 +222,8 @@ def is_sbi_summary_line(line: str) -> bool:
     Returns:
         True if this is a summary line
     """
-    summary_keywords = [
-        'total', 'amount due', 'minimum amount', 'opening balance',
-        'closing balance', 'payments', 'credits', 'debits'
-    ]
-    return any(kw in line.lower() for kw in summary_keywords)
+    line_lower = line.lower()
+    return any(kw in line_lower for kw in _SUMMARY_KEYWORDS)
 
 
 def is_sbi_reward_line(line: str) -> bool:
@@ -218,5 +236,5 @@ def is_sbi_reward_line(line: str) -> bool:
     Returns:
         True if this is a reward line
     """
-    reward_keywords = ['cashback', 'bonus', 'reward', 'points']
-    return any(kw in line.lower() for kw in reward_keywords)
+    line_lower = line.lower()
+    return any(kw in line_lower for kw in _REWARD_KEYWORDS)
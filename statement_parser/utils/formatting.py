@@ -14,6 +14,41 @@ _DATE_PATTERN_DDMMYYYY = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2,4})$')
 _DATE_PATTERN_DDMMMYYYY = re.compile(r'^(\d{1,2})\s+([A-Za-z]{3})\s+(\d{2,4})$', re.IGNORECASE)
 _DATE_PATTERN_YYYYMMDD = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
 _DATE_PATTERN_DDMMYYYY_WITH_YEAR = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+_CURRENCY_PATTERN = re.compile(r'[\u20b9$Rs?\s]', re.IGNORECASE)
+_CR_SUFFIX_PATTERN = re.compile(r'\b(Cr|CR)\b', re.IGNORECASE)
+_DR_SUFFIX_PATTERN = re.compile(r'\b(Dr|DR)\b', re.IGNORECASE)
+_CR_DR_SUFFIX_PATTERN = re.compile(r'\s*(Cr|CR|Dr|DR)\b', re.IGNORECASE)
+
+# Deletes every character a plain amount like "-1,00,000.50" is made of
+_PLAIN_AMOUNT_CHARS = str.maketrans('', '', '0123456789,.-')
+
+# Common payment processor patterns, tried in order on the upper-cased merchant
+_PROCESSOR_PATTERNS = (
+    (re.compile(r'AMZN|AMAZON'), 'Amazon'),
+    (re.compile(r'SWIGGY'), 'Swiggy'),
+    (re.compile(r'ZOMATO'), 'Zomato'),
+    (re.compile(r'PAYTM'), 'Paytm'),
+    (re.compile(r'PHONEPE'), 'PhonePe'),
+    (re.compile(r'GPAY|GOOGLEPAY'), 'Google Pay'),
+    (re.compile(r'UPI'), 'UPI'),
+    (re.compile(r'IRCTC'), 'IRCTC'),
+    (re.compile(r'ICICI'), 'ICICI Bank'),
+    (re.compile(r'HDFC'), 'HDFC Bank'),
+    (re.compile(r'SBI'), 'SBI'),
+    (re.compile(r'AXIS'), 'Axis Bank'),
+    (re.compile(r'KOTAK'), 'Kotak Mahindra'),
+    (re.compile(r'YES BANK'), 'Yes Bank'),
+    (re.compile(r'TATA 1MG'), '1mg'),
+    (re.compile(r'NEFT'), 'NEFT Transfer'),
+    (re.compile(r'RTGS'), 'RTGS Transfer'),
+    (re.compile(r'FT-'), 'Fund Transfer'),
+    (re.compile(r'EMI'), 'EMI Payment'),
+    (re.compile(r'AUTOPAY'), 'Auto Pay'),
+)
+
+# Location suffixes: "City IN" and "City, State"
+_LOCATION_IN_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+IN$')
+_LOCATION_STATE_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2,})$')
 
 # Month name to number mapping (compiled once)
 _MONTH_NAMES = {
@@ -97,7 +132,7 @@ def parse_date_cached(date_str: str, day_first: bool = True) -> Optional[str]:
     """
     Cached version of parse_date for repeated calls with the same input.
 
-    This is used by the deduplication logic to avoid redundant date parsing.
+    Statements repeat the same date string across many transactions.
 
     Args:
         date_str: Date string to parse
@@ -135,14 +170,23 @@ def parse_amount(amount_str: str) -> float:
 
     amount_str = amount_str.strip()
 
+    # Fast path: only digits, thousand separators, a sign and one decimal point
+    if not amount_str.translate(_PLAIN_AMOUNT_CHARS):
+        integer_part, point, fraction = amount_str.partition('.')
+        if ',' not in fraction and '.' not in fraction:
+            try:
+                return float(integer_part.replace(',', '') + point + fraction)
+            except ValueError:
+                pass
+
     # Remove currency symbols (without matching the decimal point)
-    amount_str = re.sub(r'[\u20b9$Rs?\s]', '', amount_str, flags=re.IGNORECASE)
+    amount_str = _CURRENCY_PATTERN.sub('', amount_str)
 
     # Remove Cr/CR/Dr/DR suffixes (but remember for sign)
-    has_cr = bool(re.search(r'\b(Cr|CR)\b', amount_str, re.IGNORECASE))
-    has_dr = bool(re.search(r'\b(Dr|DR)\b', amount_str, re.IGNORECASE))
+    has_cr = bool(_CR_SUFFIX_PATTERN.search(amount_str))
+    has_dr = bool(_DR_SUFFIX_PATTERN.search(amount_str))
 
-    amount_str = re.sub(r'\s*(Cr|CR|Dr|DR)\b', '', amount_str, flags=re.IGNORECASE).strip()
+    amount_str = _CR_DR_SUFFIX_PATTERN.sub('', amount_str).strip()
 
     # Remove thousand separators (both commas and dots depending on locale)
     # For Indian format: 1,00,000.50 -> 100000.50
@@ -168,6 +212,23 @@ def parse_amount(amount_str: str) -> float:
         return 0.0
 
 
+@lru_cache(maxsize=1024)
+def parse_amount_cached(amount_str: str) -> float:
+    """
+    Cached version of parse_amount for repeated calls with the same input.
+
+    Statement columns repeat the same strings (empty cells, "0.00", round
+    amounts) across many rows.
+
+    Args:
+        amount_str: Amount string to parse
+
+    Returns:
+        Float value of the amount, or 0.0 if parsing fails
+    """
+    return parse_amount(amount_str)
+
+
 def format_amount(amount: float, currency: str = "INR") -> str:
     """
     Format amount with currency symbol and proper separators.
@@ -246,34 +307,10 @@ def normalize_merchant(merchant: str) -> Tuple[str, str]:
     if not merchant:
         return ("", "")
 
-    # Common payment processor patterns
-    processor_patterns = {
-        r'AMZN|AMAZON': 'Amazon',
-        r'SWIGGY': 'Swiggy',
-        r'ZOMATO': 'Zomato',
-        r'PAYTM': 'Paytm',
-        r'PHONEPE': 'PhonePe',
-        r'GPAY|GOOGLEPAY': 'Google Pay',
-        r'UPI': 'UPI',
-        r'IRCTC': 'IRCTC',
-        r'ICICI': 'ICICI Bank',
-        r'HDFC': 'HDFC Bank',
-        r'SBI': 'SBI',
-        r'AXIS': 'Axis Bank',
-        r'KOTAK': 'Kotak Mahindra',
-        r'YES BANK': 'Yes Bank',
-        r'TATA 1MG': '1mg',
-        r'NEFT': 'NEFT Transfer',
-        r'RTGS': 'RTGS Transfer',
-        r'FT-': 'Fund Transfer',
-        r'EMI': 'EMI Payment',
-        r'AUTOPAY': 'Auto Pay',
-    }
-
     # Try to match known merchants
     normalized = merchant.upper()
-    for pattern, name in processor_patterns.items():
-        if re.search(pattern, normalized):
+    for pattern, name in _PROCESSOR_PATTERNS:
+        if pattern.search(normalized):
             return (name, extract_location(merchant))
 
     # If no match, try to split by spaces and take first part as merchant
@@ -302,12 +339,12 @@ def extract_location(description: str) -> str:
         Extracted location or empty string
     """
     # Pattern: City IN (common in Indian transactions)
-    match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s+IN$', description)
+    match = _LOCATION_IN_PATTERN.search(description)
     if match:
         return match.group(1)
 
     # Pattern: City, State
-    match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2,})$', description)
+    match = _LOCATION_STATE_PATTERN.search(description)
     if match:
         return f"{match.group(1)}, {match.group(2)}"
 
@@ -8,10 +8,20 @@ This module provides enhanced PDF text extraction with:
 """
 
 import os
+import re
 import tempfile
 from typing import Optional, List, Dict, Any
 
 
+# Common OCR error fixes, applied in order (compiled once at module load)
+_OCR_REPLACEMENTS = (
+    (re.compile(r'\s+'), ' '),  # Multiple spaces to single
+    (re.compile(r'(\d)\s+(\d)'), r'\1\2'),  # Remove spaces between digits
+    (re.compile(r'(\d)\s+(\.\d)'), r'\1\2'),  # Remove spaces before decimal
+)
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+
 def extract_text_from_pdf(filepath: str) -> str:
     """
     Extract text from a PDF file using multiple strategies.
@@ -192,22 +202,14 @@ def clean_extracted_text(text: str) -> str:
     if not text:
         return ""
 
-    import re
-
-    # Fix common OCR errors
-    replacements = {
-        r'\s+': ' ',  # Multiple spaces to single
-        r'(\d)\s+(\d)': r'\1\2',  # Remove spaces between digits
-        r'(\d)\s+(\.\d)': r'\1\2',  # Remove spaces before decimal
-    }
-
     cleaned = text
 
-    for pattern, replacement in replacements.items():
-        cleaned = re.sub(pattern, replacement, cleaned)
+    # Fix common OCR errors
+    for pattern, replacement in _OCR_REPLACEMENTS:
+        cleaned = pattern.sub(replacement, cleaned)
 
     # Normalize line breaks
-    cleaned = re.sub(r'\n\s*\n', '\n\n', cleaned)
+    cleaned = _BLANK_LINES_PATTERN.sub('\n\n', cleaned)
     cleaned = cleaned.strip()
 
     return cleaned
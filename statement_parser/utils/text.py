@@ -0,0 +1,16 @@
+"""
+Text utilities shared by the detector and the format parsers.
+"""
+
+from typing import List
+
+
+def head_lines(text: str, max_lines: int) -> List[str]:
+    """Split only the first max_lines lines of text, leaving the rest untouched."""
+    end = 0
+    for _ in range(max_lines):
+        end = text.find('\n', end) + 1
+        if end == 0:
+            end = len(text)
+            break
+    return text[:end].splitlines()[:max_lines]
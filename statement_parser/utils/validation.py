@@ -8,6 +8,20 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
+# Pre-compiled regex patterns (compiled once at module load)
+_DATE_FORMAT_PATTERN = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+
+# Fields every transaction must have
+_REQUIRED_FIELDS = ('date', 'description')
+
+# Output fields expected for each statement type
+_OUTPUT_SCHEMAS = {
+    'bank': ('date', 'narration', 'value_date', 'debit', 'credit', 'balance', 'reference'),
+    'credit_card': ('date', 'merchant', 'amount', 'type', 'card_no', 'reference'),
+    'upi': ('date', 'narration', 'value_date', 'debit', 'credit', 'reference', 'upi_ref'),
+}
+
+
 @dataclass
 class ValidationResult:
     """Result of validating a transaction."""
@@ -38,8 +52,7 @@ def validate_transaction(transaction: Dict[str, Any]) -> ValidationResult:
     normalized = {}
 
     # Required fields
-    required_fields = ['date', 'description']
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in transaction:
             errors.append(f"Missing required field: {field}")
 
@@ -60,7 +73,7 @@ def validate_transaction(transaction: Dict[str, Any]) -> ValidationResult:
         errors.append("Date is empty")
     else:
         # Check date format
-        if not re.match(r'^\d{2}/\d{2}/\d{4}$', date_str):
+        if not _DATE_FORMAT_PATTERN.match(date_str):
             warnings.append(f"Date may not be in correct format: {date_str}")
 
     # Validate amount (either 'amount' field or (debit or credit))
@@ -159,21 +172,10 @@ def validate_output_schema(data: List[Dict[str, Any]], statement_type: str) -> V
     Returns:
         ValidationResult indicating schema compliance
     """
-    # Schema definitions
-    bank_schema = ['date', 'narration', 'value_date', 'debit', 'credit', 'balance', 'reference']
-    credit_card_schema = ['date', 'merchant', 'amount', 'type', 'card_no', 'reference']
-    upi_schema = ['date', 'narration', 'value_date', 'debit', 'credit', 'reference', 'upi_ref']
-
-    expected = {
-        'bank': bank_schema,
-        'credit_card': credit_card_schema,
-        'upi': upi_schema,
-    }
-
-    if statement_type not in expected:
+    if statement_type not in _OUTPUT_SCHEMAS:
         return ValidationResult(False, [f"Unknown statement type: {statement_type}"], [])
 
-    required_fields = expected[statement_type]
+    required_fields = _OUTPUT_SCHEMAS[statement_type]
     errors = []
     missing_fields = []
 
@@ -219,6 +221,12 @@ def _parse_date_for_dedup(date_str: str) -> Optional[datetime]:
     return None
 
 
+def _dedup_day(tx: Dict[str, Any]) -> Optional[int]:
+    """Day number of a transaction's date for deduplication, or None if unparseable."""
+    date = _parse_date_for_dedup(tx.get('date', ''))
+    return date.toordinal() if date is not None else None
+
+
 def is_duplicate_transaction(tx1: Dict[str, Any], tx2: Dict[str, Any], threshold_days: int = 1) -> bool:
     """
     Check if two transactions are likely duplicates.
@@ -327,21 +335,24 @@ def deduplicate_transactions(transactions: List[Dict[str, Any]]) -> List[Dict[st
             groups[key] = []
         groups[key].append(tx)
 
-    # Phase 2: Check each group for duplicates
+    # Phase 2: Check each group for duplicates. A duplicate needs both dates
+    # parsed and at most a day apart, so kept transactions are indexed by day
+    # and only the neighbouring days are compared
     unique = []
+    unique_by_day: Dict[int, List[Dict[str, Any]]] = {}
     for group in groups.values():
-        if len(group) == 1:
-            # No possible duplicates
-            unique.append(group[0])
-        else:
-            # Need to check for duplicates within the group
-            for tx in group:
-                is_dup = False
-                for existing in unique:
-                    if is_duplicate_transaction(tx, existing):
-                        is_dup = True
-                        break
-                if not is_dup:
-                    unique.append(tx)
+        # A single-transaction group has no possible duplicates
+        check = len(group) > 1
+        for tx in group:
+            day = _dedup_day(tx)
+            if check and day is not None and any(
+                is_duplicate_transaction(tx, existing)
+                for nearby in (day - 1, day, day + 1)
+                for existing in unique_by_day.get(nearby, ())
+            ):
+                continue
+            unique.append(tx)
+            if day is not None:
+                unique_by_day.setdefault(day, []).append(tx)
 
     return unique
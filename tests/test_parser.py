@@ -18,6 +18,48 @@ from statement_parser.parser import ParseResult
 # Test files path
 TEST_STATEMENTS_DIR = Path(__file__).parent / "test_statements"
 
+# Small statements of each type, for the detector scoring tests
+BANK_SAMPLE = """
+HDFC Bank Ltd.
+Statement of Accounts
+Account Number: 50100123456789
+Date      Narration              Withdrawal Amt.  Deposit Amt.  Closing Balance
+01/01/24  POS AMAZON PAY         1,500.00                       10,000.00
+02/01/24  NEFT CR SALARY                          50,000.00     60,000.00
+"""
+
+CREDIT_CARD_SAMPLE = """
+HDFC Bank Credit Card Statement
+Card Number: 4123 4567 8901 1234
+Total Amount Due: 5,000.00
+Minimum Amount Due: 250.00
+Transaction Details                         Amount
+12/03/2025 CALIFORNIA BURRITO BANGALORE     293.00
+19/03/2025 TELE TRANSFER CREDIT             1,02,613.00 Cr
+"""
+
+UPI_SAMPLE = """
+Ixigo Financial Services Pvt Ltd
+UPI Transaction Statement
+Statement for January 2026
+
+Transaction Details:
+Irctc Chennai
+12 ₹2,948.00
+Jan 26 Dr
+Swiggy Mumbai
+12 ₹449.00
+Jan 26 Dr
+"""
+
+SCORING_SAMPLES = [BANK_SAMPLE, CREDIT_CARD_SAMPLE, UPI_SAMPLE, "no keywords here"]
+
+# Two small sample statements for the CLI tests
+CLI_SAMPLE_FILES = [
+    TEST_STATEMENTS_DIR / "Acct_Statement_XXXXXXXX4651_08022026 (1).txt",
+    TEST_STATEMENTS_DIR / "Acct_Statement_XXXXXXXX4651_28012026.txt",
+]
+
 
 class TestStatementDetector:
     """Tests for statement type detection."""
@@ -79,6 +121,93 @@ class TestStatementDetector:
         # (though parsing will likely fail or return no transactions)
         assert result == StatementType.BANK
 
+    def test_statement_type_compares_as_string(self):
+        """Test that statement types compare and hash like their values."""
+        assert StatementType.BANK == "bank"
+        assert {"credit_card": 1}[StatementType.CREDIT_CARD] == 1
+        assert StatementType("upi") is StatementType.UPI
+
+
+class TestKeywordScoring:
+    """Tests for the detector's keyword scoring."""
+
+    @pytest.mark.parametrize("text", SCORING_SAMPLES)
+    def test_automaton_matches_substring_fallback(self, text):
+        """Test that the Aho-Corasick pass finds the same keywords as the fallback."""
+        pytest.importorskip("ahocorasick")
+        from statement_parser import detector as detector_module
+
+        text_lower = text.lower()
+        assert detector_module._keyword_automaton() is not None
+        assert (detector_module._find_keywords(text_lower)
+                == detector_module._find_keywords_by_substring(text_lower))
+
+    @pytest.mark.parametrize("text", SCORING_SAMPLES)
+    def test_scores_without_automaton(self, text, monkeypatch):
+        """Test that scores are the same with and without pyahocorasick."""
+        from statement_parser import detector as detector_module
+
+        scores = detector_module._score_all(text)
+        monkeypatch.setattr(detector_module, "_keyword_automaton", lambda: None)
+
+        assert detector_module._score_all(text) == scores
+
+    @pytest.mark.parametrize("text", SCORING_SAMPLES)
+    def test_single_type_scorers_match_score_all(self, text):
+        """Test that each per-type scorer gives the same score as _score_all."""
+        from statement_parser import detector as detector_module
+
+        scores = detector_module._score_all(text)
+        found = detector_module._find_keywords(text.lower())
+
+        assert detector_module._score_bank_statement(text) == scores[StatementType.BANK]
+        assert detector_module._score_credit_card(text, found=found) == scores[StatementType.CREDIT_CARD]
+        assert detector_module._score_upi_statement(text, found=found) == scores[StatementType.UPI]
+
+    @pytest.mark.parametrize("text, expected", [
+        (BANK_SAMPLE, StatementType.BANK),
+        (CREDIT_CARD_SAMPLE, StatementType.CREDIT_CARD),
+        (UPI_SAMPLE, StatementType.UPI),
+        ("no keywords here", StatementType.UNKNOWN),
+    ])
+    def test_infer_statement_type_matches_full_scores(self, text, expected):
+        """Test that the confident-bank fast path agrees with the full score argmax."""
+        from statement_parser import detector as detector_module
+
+        scores = detector_module._score_all(text)
+        best_type = max(scores, key=scores.get)
+        full_result = best_type if scores[best_type] > 0 else StatementType.UNKNOWN
+
+        assert full_result == expected
+        assert detector_module._infer_statement_type(text) == expected
+
+    def test_infer_statement_type_settles_bank_early(self):
+        """Test that a confident bank score skips the other pattern scans."""
+        from statement_parser import detector as detector_module
+
+        settled = detector_module._score_all(BANK_SAMPLE, settle_early=True)
+        full = detector_module._score_all(BANK_SAMPLE)
+
+        assert settled[StatementType.BANK] == full[StatementType.BANK]
+        assert settled[StatementType.BANK] >= detector_module._CONFIDENT_BANK_SCORE
+        assert (settled[StatementType.BANK]
+                >= full[StatementType.CREDIT_CARD] + detector_module._MAX_CREDIT_CARD_BONUS)
+        assert detector_module._infer_statement_type(BANK_SAMPLE) == StatementType.BANK
+
+    def test_substring_fallback_on_statement_file(self):
+        """Test the substring fallback against plain checks on a real statement."""
+        from statement_parser import detector as detector_module
+
+        text_file = TEST_STATEMENTS_DIR / "Acct_Statement_XXXXXXXX4651_08022026.txt"
+        if not text_file.exists():
+            pytest.skip("Test text file not available")
+
+        text_lower = text_file.read_text().lower()
+        expected = {kw for kw in detector_module._SCORE_KEYWORDS if kw in text_lower}
+
+        assert detector_module._find_keywords_by_substring(text_lower) == expected
+        assert detector_module._find_keywords(text_lower) == expected
+
 
 class TestStatementParser:
     """Tests for the main StatementParser."""
@@ -215,6 +344,23 @@ class TestStatementParser:
         assert summary['total_debits'] == 200.00
         assert summary['net_amount'] == 300.00
 
+    def test_deduplicate_transactions(self):
+        """Test that only near-dated repeats are dropped as duplicates."""
+        from statement_parser.utils.validation import deduplicate_transactions
+
+        transactions = [
+            {'date': '01/01/2024', 'description': 'Amazon Purchase', 'debit': 500.00},
+            {'date': '02/01/2024', 'description': 'Amazon', 'debit': 500.00},
+            {'date': '02/01/2024', 'description': 'Swiggy Order', 'debit': 250.00},
+            {'date': '05/01/2024', 'description': 'Amazon Purchase', 'debit': 500.00},
+            {'date': '05/01/2024', 'description': 'Zomato Order', 'debit': 300.00},
+        ]
+
+        unique = deduplicate_transactions(transactions)
+
+        # The 02/01 Amazon row repeats the 01/01 one; 05/01 is too far apart
+        assert unique == [transactions[0], transactions[2], transactions[3], transactions[4]]
+
 
 class TestOutputGenerator:
     """Tests for the OutputGenerator class."""
@@ -330,6 +476,209 @@ class TestPatternLearning:
         # Should extract at least some transactions
         assert len(result.transactions) >= 2
 
+    # Expected outputs are those of the four trailing date/amount/balance/number
+    # regex substitutions that _strip_trailing_numbers replaced
+    @pytest.mark.parametrize("description, expected", [
+        ("AMAZON PAY", "AMAZON PAY"),
+        ("AMAZON PAY 10.00", "AMAZON PAY"),
+        ("AMAZON PAY 10.00 2", "AMAZON PAY 10.00"),
+        ("AMAZON PAY 10.00 2 30.00", "AMAZON PAY"),
+        ("AMAZON PAY 10.00 2 30.00 4", "AMAZON PAY 10.00"),
+        ("AMAZON PAY 10.00 2 30.00 4 50.00", "AMAZON PAY"),
+        ("AMAZON PAY 10.00 2 30.00 4 50.00 6", "AMAZON PAY"),
+        ("AMAZON PAY 10.00 2 30.00 4 50.00 6 70.00", "AMAZON PAY 10.00"),
+        ("AMAZON PAY 01/01/2024", "AMAZON PAY"),
+        ("AMAZON PAY 1/1/24", "AMAZON PAY"),
+        ("AMAZON PAY 250.00 01/01/2024", "AMAZON PAY"),
+        ("AMAZON PAY 250 1000.00 01/01/24", "AMAZON PAY 250"),
+        ("AMAZON PAY 10 20 30 40 01/01/2024", "AMAZON PAY 10"),
+        ("NEFT 01/01/2024 250.00", "NEFT 01/01/2024"),
+        ("AMAZON PAY 01/01/2024 250 1000.00", "AMAZON PAY 01/01/2024 250"),
+        ("IMPS 1,500.00", "IMPS 1,500.00"),
+        ("REF 12.5.6", "REF 12.5.6"),
+        ("PAY 123/45/2024", "PAY 123/45/2024"),
+        ("12345", "12345"),
+    ])
+    def test_strip_trailing_numbers(self, description, expected):
+        """Test that trailing dates and number runs are stripped like the old regex chain."""
+        from statement_parser.formats.bank_statement import _strip_trailing_numbers
+
+        assert _strip_trailing_numbers(description) == expected
+
+    # Expected outputs are those of re.sub(r'^[^\w]+|[^\w]+$', '', text)
+    @pytest.mark.parametrize("text, expected", [
+        ("--AMAZON PAY--", "AMAZON PAY"),
+        ("(Ref# 123)", "Ref# 123"),
+        ("...NEFT / SALARY /", "NEFT / SALARY"),
+        ("₹500 PAY.", "500 PAY"),
+        ("café!", "café"),
+        ("Ω-OMEGA-", "Ω-OMEGA"),
+        ("_under_", "_under_"),
+        ("²squared²", "²squared²"),
+        ("@#$%", ""),
+        ("  ", ""),
+        ("", ""),
+    ])
+    def test_strip_edge_punctuation(self, text, expected):
+        """Test that edge trimming keeps the same characters as the \\w regex."""
+        from statement_parser.formats.bank_statement import _strip_edge_punctuation
+
+        assert _strip_edge_punctuation(text) == expected
+
+    # Expected outputs are those of re.sub(r'[\d\s]+$', '', text)
+    @pytest.mark.parametrize("text, expected", [
+        ("AMAZON 123 456", "AMAZON"),
+        ("PAY\t42\t", "PAY"),
+        ("PAY 12 ", "PAY"),
+        ("AMAZON 1,234", "AMAZON 1,"),
+        ("A²", "A²"),
+        ("AMAZON", "AMAZON"),
+        ("123", ""),
+        ("", ""),
+    ])
+    def test_generic_strip_trailing_digits(self, text, expected):
+        """Test that generic descriptions lose trailing digits like the old regex."""
+        from statement_parser.patterns.generic import _strip_trailing_digits
+
+        assert _strip_trailing_digits(text) == expected
+
+    @pytest.mark.parametrize("description, is_credit", [
+        ("NEFT CR-SALARY", True),
+        ("UPI-CREDCLUB-PAYMENT", True),
+        ("FT-12345 FROM SAVINGS", True),
+        ("FT- 12345", True),
+        ("FT-/IMPS/REF", True),
+        ("Interest Credited", True),
+        ("TRANSFER IN FROM RD", True),
+        ("SCRAP DEALER PAYMENT", False),
+        ("SWIFT-PAYMENT", False),
+        ("POS AMAZON PAY", False),
+    ])
+    def test_credit_keywords_match_whole_words(self, description, is_credit):
+        """Test that credit keywords match as words, and FT- before any separator."""
+        from statement_parser.formats.bank_statement import _CREDIT_KEYWORD_PATTERN
+
+        assert (_CREDIT_KEYWORD_PATTERN.search(description) is not None) == is_credit
+
+    def test_adaptive_parse_merges_int_and_float_amounts(self, monkeypatch):
+        """Test that strategies returning 1500 and 1500.0 yield one transaction."""
+        from statement_parser.formats.bank_statement import BankStatementParser
+
+        parser = BankStatementParser()
+        tx = {'date': '01/01/2024', 'description': 'Amazon Purchase', 'debit': 1500, 'credit': 0}
+        monkeypatch.setattr(parser, '_parse_column_based', lambda lines: [tx])
+        monkeypatch.setattr(parser, '_parse_multiline_transactions',
+                            lambda lines: [dict(tx, debit=1500.0, credit=0.0)])
+        monkeypatch.setattr(parser, '_parse_single_line_transactions', lambda lines: [])
+
+        assert parser._parse_adaptive("", []) == [tx]
+
+    def test_csv_repeated_rows_yield_distinct_transactions(self):
+        """Test that a short CSV whose rows repeat gives exactly its distinct rows."""
+        from statement_parser.formats.bank_statement import BankStatementParser
+
+        rows = [
+            '01/01/2024,UPI PAYMENT SWIGGY FOOD ORDER,250.00,,10000.00',
+            '02/01/2024,NEFT SALARY CREDIT ACME CORP,,50000.00,60000.00',
+            '03/01/2024,POS AMAZON RETAIL PURCHASE,1500.00,,58500.00',
+        ]
+        text = 'Date,Narration,Debit,Credit,Balance\n' + '\n'.join(rows + rows) + '\n'
+
+        result = BankStatementParser().parse(text)
+
+        assert [(tx['date'], tx['description'], tx['debit'], tx['credit'])
+                for tx in result.transactions] == [
+            ('01/01/2024', 'UPI PAYMENT SWIGGY FOOD ORDER', 250.0, 0.0),
+            ('02/01/2024', 'NEFT SALARY CREDIT ACME CORP', 0.0, 50000.0),
+            ('03/01/2024', 'POS AMAZON RETAIL PURCHASE', 1500.0, 0.0),
+        ]
+
+    def test_csv_parser_handles_quoted_commas(self):
+        """Test that quoted CSV fields keep their embedded commas."""
+        from statement_parser.formats.bank_statement import BankStatementParser
+
+        parser = BankStatementParser()
+        text = (
+            'Date,Narration,Debit,Credit,Balance\n'
+            '01/01/2024,"Amazon, Purchase","1,500.00",,"10,000.00"\n'
+        )
+
+        transactions = parser._parse_csv(text)
+
+        assert len(transactions) == 1
+        assert transactions[0]['description'] == 'Amazon, Purchase'
+        assert transactions[0]['debit'] == 1500.00
+        assert transactions[0]['balance'] == 10000.00
+
+
+class TestFormatting:
+    """Tests for the formatting helpers."""
+
+    # Expected values are those of parse_amount before its plain-number fast
+    # path; the malformed ones fall through to the general path
+    @pytest.mark.parametrize("amount_str, expected", [
+        ("1,234.56", 1234.56),
+        ("1,00,000.50", 100000.50),
+        ("1234", 1234.0),
+        ("-250.00", -250.0),
+        ("  42  ", 42.0),
+        ("0.00", 0.0),
+        ("12,34", 1234.0),
+        ("1.", 1.0),
+        (".5", 0.5),
+        ("1.2.3", 1.2),
+        ("1,234.5,6", 0.0),
+        ("--5", 0.0),
+        (",", 0.0),
+        ("-", 0.0),
+        ("", 0.0),
+        ("₹1,234.56", 1234.56),
+        ("abc", 0.0),
+    ])
+    def test_parse_amount(self, amount_str, expected):
+        """Test that plain and malformed amounts parse as before the fast path."""
+        from statement_parser.utils.formatting import parse_amount
+
+        assert parse_amount(amount_str) == expected
+
+
+def _failing_worker_init(options):
+    """Stand-in for cli._init_worker that kills the worker process."""
+    raise RuntimeError("worker start failed")
+
+
+@pytest.mark.skipif(
+    not all(path.exists() for path in CLI_SAMPLE_FILES),
+    reason="Test statements not available"
+)
+class TestCLI:
+    """Tests for the command-line interface."""
+
+    def _run_main(self, monkeypatch, tmp_path, *extra_args):
+        from statement_parser import cli
+
+        argv = ['statement-parser', '-q', '-f', 'json', '-o', str(tmp_path), *extra_args]
+        monkeypatch.setattr(sys, 'argv', argv + [str(path) for path in CLI_SAMPLE_FILES])
+        return cli.main()
+
+    def test_parallel_jobs(self, monkeypatch, tmp_path):
+        """Test that -j 2 parses every file and writes its output."""
+        assert self._run_main(monkeypatch, tmp_path, '-j', '2') == 0
+
+        for path in CLI_SAMPLE_FILES:
+            assert (tmp_path / f"{path.stem}_parsed.json").exists()
+
+    def test_broken_pool_falls_back_to_serial(self, monkeypatch, tmp_path):
+        """Test that a worker failing to start does not lose any files."""
+        from statement_parser import cli
+
+        monkeypatch.setattr(cli, '_init_worker', _failing_worker_init)
+
+        assert self._run_main(monkeypatch, tmp_path, '-j', '2') == 0
+
+        for path in CLI_SAMPLE_FILES:
+            assert (tmp_path / f"{path.stem}_parsed.json").exists()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])